@@ -4,7 +4,16 @@ Configuration Loader
 """
 import yaml
 import os
-from typing import Dict, Any, Optional
+import pickle
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+
+# LibYAML C 바인딩이 있으면 사용 (PyYAML wheel은 기본적으로 libyaml 포함)
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 class ConfigLoader:
     """설정 파일 로더"""
@@ -16,20 +25,89 @@ class ConfigLoader:
         """
         self.config_path = config_path
         self._config = None
+        self._flat = {}
         self._load_config()
+        self._build_flat_index()
     
     def _load_config(self) -> None:
-        """설정 파일 로드"""
+        """설정 파일 로드 (mtime이 같으면 pickle 캐시 사용)"""
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
+        mtime = os.stat(self.config_path).st_mtime_ns
+        cache_path = self.config_path + '.pkl'
+        
+        # pickle 캐시가 유효하면 YAML 파싱 생략
+        cached = self._read_cache(cache_path, mtime)
+        if cached is not None:
+            self._config = MappingProxyType(cached)
+            return
+        
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                self._config = yaml.safe_load(file)
+            # LibYAML은 bytes 입력을 직접 디코딩하므로 바이너리 모드로 읽음
+            with open(self.config_path, 'rb') as file:
+                self._config = yaml.load(file, Loader=_Loader)
         except yaml.YAMLError as e:
+            self._remove_cache(cache_path)
             raise ValueError(f"Failed to parse YAML config: {e}")
         except Exception as e:
             raise ValueError(f"Failed to load config file: {e}")
+        
+        self._write_cache(cache_path, mtime)
+        
+        # 로드 후 최상위 매핑은 읽기 전용 (pickle 저장 이후에 감싸야 함, 하위 값은 감싸지 않음)
+        if isinstance(self._config, dict):
+            self._config = MappingProxyType(self._config)
+    
+    def _read_cache(self, cache_path: str, mtime: int) -> Optional[Dict[str, Any]]:
+        """mtime이 일치하는 pickle 캐시 로드 (없거나 오래되면 None)"""
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('mtime') != mtime:
+            return None
+        return cached.get('data')
+    
+    def _write_cache(self, cache_path: str, mtime: int) -> None:
+        """파싱된 설정을 pickle 캐시로 원자적 저장"""
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'mtime': mtime, 'data': self._config}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # 캐시 저장 실패는 치명적이지 않음 (읽기 전용 디렉토리 등)
+            self._remove_cache(tmp_path)
+    
+    @staticmethod
+    def _remove_cache(cache_path: str) -> None:
+        """캐시 파일 삭제 (없으면 무시)"""
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+    
+    def _build_flat_index(self) -> None:
+        """점 표기법 키 -> 값 평탄화 인덱스 생성 (하위 dict도 함께 등록)"""
+        flat = {}
+        
+        def walk(node: Dict[str, Any], prefix: str) -> None:
+            for key, value in node.items():
+                # 기존 get()과 동일하게 문자열 키만 점 표기법으로 접근 가능
+                if not isinstance(key, str):
+                    continue
+                path = f"{prefix}.{key}" if prefix else key
+                flat[path] = value
+                if isinstance(value, dict):
+                    walk(value, path)
+        
+        if isinstance(self._config, Mapping):
+            walk(self._config, "")
+        self._flat = MappingProxyType(flat)
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -42,16 +120,7 @@ class ConfigLoader:
         Returns:
             설정값
         """
-        keys = key_path.split('.')
-        value = self._config
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key_path, default)
     
     def get_robot_geometries(self) -> Dict[int, Dict[str, Any]]:
         """로봇 기하학 구성 전체 반환"""
@@ -85,17 +154,23 @@ class ConfigLoader:
     def reload(self) -> None:
         """설정 파일 다시 로드"""
         self._load_config()
+        self._build_flat_index()
+        get_robot_geometry.cache_clear()
+        get_default_geometry_id.cache_clear()
 
 # 전역 설정 인스턴스 (싱글톤 패턴)
 _config_instance = None
 
-def get_config(config_path: str = "config.yaml") -> ConfigLoader:
-    """전역 설정 인스턴스 반환"""
+def _init_config(config_path: str) -> ConfigLoader:
+    """전역 설정 인스턴스 생성"""
     global _config_instance
-    if _config_instance is None:
-        _config_instance = ConfigLoader(config_path)
+    _config_instance = ConfigLoader(config_path)
     return _config_instance
 
+def get_config(config_path: str = "config.yaml") -> ConfigLoader:
+    """전역 설정 인스턴스 반환"""
+    return _config_instance or _init_config(config_path)
+
 def reload_config() -> None:
     """전역 설정 다시 로드"""
     global _config_instance
@@ -103,6 +178,7 @@ def reload_config() -> None:
         _config_instance.reload()
 
 # 편의 함수들
+@functools.lru_cache(maxsize=None)
 def get_robot_geometry(geometry_id: int) -> Optional[Dict[str, Any]]:
     """특정 로봇 기하학 구성 반환"""
     config = get_config()
@@ -113,6 +189,7 @@ def list_robot_geometries() -> Dict[int, Dict[str, Any]]:
     config = get_config()
     return config.get_robot_geometries()
 
+@functools.lru_cache(maxsize=None)
 def get_default_geometry_id() -> int:
     """기본 로봇 기하학 ID 반환"""
     config = get_config()
@@ -122,3 +199,9 @@ def get_default_geometry_id() -> int:
 def get_geometry_config(geometry_id: int) -> Optional[Dict[str, Any]]:
     """get_robot_geometry의 별칭 (하위 호환성)"""
     return get_robot_geometry(geometry_id)
+
+def __getattr__(name: str) -> Any:
+    """CONFIG는 첫 접근 시 get_config()로 지연 생성 (import 시 파일 I/O 없음)"""
+    if name == "CONFIG":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
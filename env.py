@@ -1,21 +1,14 @@
 # env.py - Environment Creation Module (모듈 2: 시뮬레이션 실행)
-from Box2D.b2 import world, dynamicBody, staticBody, polygonShape, revoluteJointDef
-import math
-import os
-import numpy as np
-from typing import List, Tuple, Optional
+from Box2D.b2 import world, staticBody
 from pointcloud import PointcloudLoader
 from config_loader import get_geometry_config
+from robot_builder import create_robot_links
 
-def create_ellipse_vertices(width, height, num_points=16):
-    """타원형 버텍스 생성"""
-    vertices = []
-    for i in range(num_points):
-        angle = 2 * math.pi * i / num_points
-        x = width * math.cos(angle)
-        y = height * math.sin(angle)
-        vertices.append((x, y))
-    return vertices
+# 정적 환경 장애물 위치 (static box)
+_STATIC_OBSTACLE_POSITIONS = ((4, 3), (6, 1), (8, 3))
+
+# 이미 안내 메시지를 출력한 geometry ID (리셋마다 반복 출력 방지)
+_printed_ids = set()
 
 def make_world(geometry_id=0, env_file=None):
     """
@@ -31,7 +24,9 @@ def make_world(geometry_id=0, env_file=None):
     # Get robot geometry configuration
     try:
         geometry_config = get_geometry_config(geometry_id)
-        print(f"Using geometry {geometry_id}: {geometry_config['name']}")
+        if geometry_id not in _printed_ids:
+            _printed_ids.add(geometry_id)
+            print(f"Using geometry {geometry_id}: {geometry_config['name']}")
     except ValueError as e:
         print(f"Error: {e}")
         print("Using default geometry (ID: 0)")
@@ -46,43 +41,12 @@ def _make_static_world(geometry_config):
     """Create static environment with predefined obstacles"""
     W = world(gravity=(0, 0), doSleep=True)
 
-    # 고정 베이스
-    base = W.CreateStaticBody(position=(0,0))
-
-    # Get robot configuration
-    link_lengths = geometry_config['link_lengths']
-    link_widths = geometry_config['link_widths']
-    link_shape = geometry_config['link_shape']
-    
-    links = []
-    for i, length in enumerate(link_lengths):
-        x = sum(link_lengths[:i]) + length/2
-        body = W.CreateDynamicBody(position=(x, 0), angle=0)
-        
-        if link_shape == "ellipse":
-            # 타원형 링크 - geometry config의 width를 기반으로 타원 크기 계산
-            ellipse_width = length * 0.5  # 링크 길이에 비례한 타원 폭
-            ellipse_height = link_widths[i]  # geometry config의 width를 높이로 사용
-            vertices = create_ellipse_vertices(ellipse_width, ellipse_height)
-            body.CreatePolygonFixture(vertices=vertices, density=1, friction=0.3)
-        else:
-            # 기본 사각형 링크
-            body.CreatePolygonFixture(box=(length/2, link_widths[i]/2), density=1, friction=0.3)
-        
-        links.append(body)
-
-    # 관절 연결 (베이스-1, 1-2, 2-3)
-    W.CreateJoint(revoluteJointDef(bodyA=base,   bodyB=links[0],
-                                   localAnchorA=(0,0),
-                                   localAnchorB=(-link_lengths[0]/2,0)))
-    for i in range(len(links)-1):
-        W.CreateJoint(revoluteJointDef(bodyA=links[i], bodyB=links[i+1],
-                                       localAnchorA=(link_lengths[i]/2,0),
-                                       localAnchorB=(-link_lengths[i+1]/2,0)))
+    # 로봇 (베이스, 링크, 관절)
+    base, links = create_robot_links(W, geometry_config)
 
     # 장애물 (static box)
     obstacles = []
-    for pos in [(4,3), (6,1), (8,3)]:
+    for pos in _STATIC_OBSTACLE_POSITIONS:
         obs = W.CreateStaticBody(position=pos)
         obs.CreatePolygonFixture(box=(0.3, 0.3))
         obstacles.append(obs)
@@ -116,61 +80,16 @@ def _make_pointcloud_world(geometry_config, pointcloud_file):
         W = world(gravity=(0, 0), doSleep=True)
     
     # Create robot in the pointcloud world
-    links = _create_robot_links(W, geometry_config)
+    base, links = create_robot_links(W, geometry_config)
     
     # Extract obstacles from world (all static bodies except robot base)
-    # Robot base is the first static body created
-    obstacles = []
-    robot_base = None
-    for body in W.bodies:
-        if body.type == staticBody:
-            if robot_base is None:
-                robot_base = body  # First static body is the robot base
-            else:
-                obstacles.append(body)  # Others are obstacles
+    # SWIG 프록시는 매번 새 객체이므로 `is` 대신 `!=`로 비교
+    _static = staticBody
+    obstacles = [b for b in W.bodies if b.type == _static and b != base]
     
     return W, links, obstacles
 
 
-def _create_robot_links(W, geometry_config):
-    """Create robot links in given world"""
-    # 고정 베이스
-    base = W.CreateStaticBody(position=(0,0))
-
-    # Get robot configuration
-    link_lengths = geometry_config['link_lengths']
-    link_widths = geometry_config['link_widths']
-    link_shape = geometry_config['link_shape']
-    
-    links = []
-    for i, length in enumerate(link_lengths):
-        x = sum(link_lengths[:i]) + length/2
-        body = W.CreateDynamicBody(position=(x, 0), angle=0)
-        
-        if link_shape == "ellipse":
-            # 타원형 링크 - geometry config의 width를 기반으로 타원 크기 계산
-            ellipse_width = length * 0.5  # 링크 길이에 비례한 타원 폭
-            ellipse_height = link_widths[i]  # geometry config의 width를 높이로 사용
-            vertices = create_ellipse_vertices(ellipse_width, ellipse_height)
-            body.CreatePolygonFixture(vertices=vertices, density=1, friction=0.3)
-        else:
-            # 기본 사각형 링크
-            body.CreatePolygonFixture(box=(length/2, link_widths[i]/2), density=1, friction=0.3)
-        
-        links.append(body)
-
-    # 관절 연결 (베이스-1, 1-2, 2-3)
-    W.CreateJoint(revoluteJointDef(bodyA=base,   bodyB=links[0],
-                                   localAnchorA=(0,0),
-                                   localAnchorB=(-link_lengths[0]/2,0)))
-    for i in range(len(links)-1):
-        W.CreateJoint(revoluteJointDef(bodyA=links[i], bodyB=links[i+1],
-                                       localAnchorA=(link_lengths[i]/2,0),
-                                       localAnchorB=(-link_lengths[i+1]/2,0)))
-    
-    return links
-
-
 def list_available_pointclouds(data_dir="data/pointcloud"):
     """List available pointcloud files"""
     loader = PointcloudLoader(data_dir)
@@ -1,10 +1,17 @@
 # main.py - 모듈 2: 시뮬레이션 실행
 import pygame, sys
+import os
 import argparse
+import logging
 import numpy as np
 from env import make_world, list_available_pointclouds
 from simulation import RobotSimulation
-from render import draw_world
+from render import draw_world_static, draw_world_dynamic, PPM, ORIGIN
+
+# 화면 좌표 변환 상수와 색상 (매 프레임 튜플 재생성 방지)
+ORIGIN_X, ORIGIN_Y = ORIGIN
+RED = (255, 0, 0)
+WHITE = (255, 255, 255)
 
 # 명령행 인자 파싱
 def parse_args():
@@ -18,25 +25,27 @@ def parse_args():
     parser.add_argument('--policy', choices=['potential_field', 'potential_field_pd', 'rmp'], 
                         default='potential_field_pd',
                         help='Control policy (default: potential_field_pd)')
+    parser.add_argument('--vel-iters', type=int, default=6,
+                        help='Box2D velocity iterations per step, default: 6 (raise for collision-heavy pointcloud scenes)')
+    parser.add_argument('--pos-iters', type=int, default=2,
+                        help='Box2D position iterations per step, default: 2 (raise for collision-heavy pointcloud scenes)')
     parser.add_argument('--list-geometries', action='store_true',
                         help='List available robot geometries and exit')
+    parser.add_argument('--debug', action='store_true',
+                        help='Log per-step end-effector/joint/torque debug output')
     
     return parser.parse_args()
 
 # target 위치 시각화 함수
-def draw_target(screen, target, PPM=50.0, ORIGIN=(100, 500)):
-    # 월드 좌표를 화면 좌표로 변환
-    x, y = target
-    sx = ORIGIN[0] + x * PPM
-    sy = ORIGIN[1] - y * PPM
-    
-    # 빨간 원으로 target 그리기
-    pygame.draw.circle(screen, (255, 0, 0), (int(sx), int(sy)), 8)
+def draw_target(screen, target_screen):
+    # 빨간 원으로 target 그리기 (target_screen: 미리 변환된 화면 좌표)
+    pygame.draw.circle(screen, RED, target_screen, 8)
     # 중심점 표시
-    pygame.draw.circle(screen, (255, 255, 255), (int(sx), int(sy)), 2)
+    pygame.draw.circle(screen, WHITE, target_screen, 2)
 
 # 1) 명령행 인자 처리
 args = parse_args()
+logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
 
 # Handle --list-geometries flag
 if args.list_geometries:
@@ -56,8 +65,6 @@ if args.list_geometries:
 
 # Validate pointcloud file if specified
 if args.env and args.env != 'static':
-    import os
-    
     # Convert environment name to full path: env_name -> data/env_name/env_name.ply
     env_name = args.env
     if env_name.endswith('.ply'):
@@ -92,7 +99,10 @@ if args.env and args.env != 'static':
 env_type = 'static' if args.env == 'static' else 'pointcloud'
 
 # Parse target position
-target = np.array(args.target)
+target = np.asarray(args.target, dtype=np.float64)
+tx, ty = float(target[0]), float(target[1])
+# target의 화면 좌표 (실행 중 불변이므로 한 번만 변환)
+TARGET_SCREEN = (ORIGIN_X + int(tx * PPM), ORIGIN_Y - int(ty * PPM))
 
 print(f"Environment: {env_type}")
 print(f"Target position: {target}")
@@ -117,34 +127,71 @@ world, links, obstacles = make_world(
 )
 
 # 4) 시뮬레이션 객체 생성
-simulation = RobotSimulation(world, links, obstacles, target, args.policy)
+simulation = RobotSimulation(world, links, obstacles, target, args.policy,
+                            vel_iters=args.vel_iters, pos_iters=args.pos_iters)
+
+# 5) HUD 준비 - 폰트와 정적 정보 텍스트(target/policy/env는 실행 중 불변)는 한 번만 생성
+FONT = pygame.font.Font(None, 36)
+info_text = f"Target: ({tx:.1f}, {ty:.1f}) | Policy: {args.policy} | Env: {args.env}"
+STATIC_INFO_SURF = FONT.render(info_text, True, WHITE)
+
+# 정적 월드(배경 + 장애물)는 움직이지 않으므로 배경 Surface에 한 번만 그림
+background = pygame.Surface((SCREEN_W, SCREEN_H)).convert()
+draw_world_static(background, world)
 
-# 5) 메인 루프
+# 정적 HUD(target 마커 + 정보 텍스트)를 투명 오버레이 한 장에 미리 합성
+hud = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA).convert_alpha()
+draw_target(hud, TARGET_SCREEN)
+hud.blit(STATIC_INFO_SURF, (10, 10))
+
+# 루프에서 매 프레임 호출되는 함수들을 로컬 이름으로 바인딩
+event_get = pygame.event.get
+display_flip = pygame.display.flip
+display_update = pygame.display.update
+clock_tick = clock.tick
+
+# 6) 메인 루프
+active = True  # 창이 최소화되면 False (물리/렌더링 생략)
+full_redraw = True  # 첫 프레임/창 복귀 시에는 화면 전체를 갱신
+prev_dirty = []  # 이전 프레임에서 로봇/거리 텍스트가 그려진 영역 (지우기용)
 while True:
-    for e in pygame.event.get():
+    for e in event_get():
         if e.type == pygame.QUIT:
             pygame.quit(); sys.exit()
+        elif e.type == pygame.ACTIVEEVENT and e.state & pygame.APPACTIVE:
+            active = bool(e.gain)
+            full_redraw = True
+        elif e.type == pygame.VIDEOEXPOSE:
+            full_redraw = True
+
+    # 최소화 상태에서는 flip/tick 없이 대기만 함
+    if not active:
+        pygame.time.wait(100)
+        continue
 
     # 시뮬레이션 한 스텝 실행
-    step_info = simulation.step(debug=True)
+    step_info = simulation.step(debug=args.debug)
 
-    # 렌더링
-    draw_world(screen, world, SCREEN_W, SCREEN_H)
+    # 렌더링 (캐시된 정적 배경 위에 로봇 링크만 다시 그림)
+    screen.blit(background, (0, 0))
+    robot_rect = draw_world_dynamic(screen, world)
     
-    # target 위치 시각화
-    draw_target(screen, target)
-    
-    # 정보 텍스트 표시
-    font = pygame.font.Font(None, 36)
-    info_text = f"Target: ({target[0]:.1f}, {target[1]:.1f}) | Policy: {args.policy} | Env: {args.env}"
-    text_surface = font.render(info_text, True, (255, 255, 255))
-    screen.blit(text_surface, (10, 10))
+    # target 마커 + 정보 텍스트 (미리 합성된 오버레이)
+    screen.blit(hud, (0, 0))
     
     # 거리 정보 표시
     distance = simulation.get_distance_to_target()
     dist_text = f"Distance to target: {distance:.3f}m"
-    dist_surface = font.render(dist_text, True, (255, 255, 255))
-    screen.blit(dist_surface, (10, 50))
+    dist_surface = FONT.render(dist_text, True, WHITE)
+    dist_rect = screen.blit(dist_surface, (10, 50))
+    
+    # 바뀐 영역(이번 프레임 + 이전 프레임의 로봇/거리 텍스트)만 디스플레이에 반영
+    dirty = [dist_rect] if robot_rect is None else [robot_rect, dist_rect]
+    if full_redraw:
+        display_flip()
+        full_redraw = False
+    else:
+        display_update(dirty + prev_dirty)
+    prev_dirty = dirty
     
-    pygame.display.flip()
-    clock.tick(FPS)
\ No newline at end of file
+    clock_tick(FPS)
\ No newline at end of file
@@ -0,0 +1,78 @@
+# ply_io.py - 포인트클라우드 PLY 읽기/쓰기 (pointcloud/, pose/ 공용)
+# 저장은 binary_little_endian, 읽기는 기존 ascii 파일도 지원
+import numpy as np
+
+_PLY_HEADER = (
+    "ply\n"
+    "format binary_little_endian 1.0\n"
+    "element vertex {count}\n"
+    "property float x\n"
+    "property float y\n"
+    "property float z\n"
+    "end_header\n"
+)
+
+
+def encode_ply_points(points):
+    """(N, 2) 포인트를 z=0인 binary little-endian PLY 바이트로 인코딩"""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    vertices = np.zeros((len(points), 3), dtype='<f4')
+    vertices[:, :2] = points
+    return _PLY_HEADER.format(count=len(vertices)).encode('ascii') + vertices.tobytes()
+
+
+def write_ply_points(filepath, points):
+    """(N, 2) 포인트를 binary little-endian PLY 파일로 저장"""
+    with open(filepath, 'wb') as f:
+        f.write(encode_ply_points(points))
+
+    return filepath
+
+
+def _read_header(f):
+    """헤더 파싱 -> (format, vertex 수, vertex property 수). f는 바이너리 모드"""
+    fmt, count, num_props = 'ascii', 0, 0
+    in_vertex = False
+
+    line = f.readline()
+    while line and not line.startswith(b'end_header'):
+        tokens = line.split()
+        if tokens[:1] == [b'format']:
+            fmt = tokens[1].decode('ascii')
+        elif tokens[:1] == [b'element']:
+            in_vertex = tokens[1] == b'vertex'
+            if in_vertex:
+                count = int(tokens[2])
+        elif tokens[:1] == [b'property'] and in_vertex:
+            if tokens[1] not in (b'float', b'float32'):
+                raise ValueError(f"Unsupported PLY vertex property type: {tokens[1].decode()}")
+            num_props += 1
+        line = f.readline()
+
+    if not line:
+        raise ValueError("Invalid PLY format: no end_header found")
+
+    return fmt, count, num_props
+
+
+def read_ply_vertex_count(filepath):
+    """PLY 헤더의 vertex 수만 읽기"""
+    with open(filepath, 'rb') as f:
+        return _read_header(f)[1]
+
+
+def read_ply_points(filepath):
+    """PLY 파일에서 (N, 2) x, y 포인트 로드"""
+    with open(filepath, 'rb') as f:
+        fmt, count, num_props = _read_header(f)
+
+        if fmt == 'binary_little_endian':
+            data = np.fromfile(f, dtype='<f4', count=count * num_props)
+            return data.reshape(-1, num_props)[:, :2].astype(np.float64)
+
+        if fmt != 'ascii':
+            raise ValueError(f"Unsupported PLY format: {fmt}")
+
+        rows = [line.split()[:2] for line in f.read().decode('ascii').splitlines() if line.strip()]
+
+    return np.array(rows, dtype=np.float64).reshape(-1, 2)
@@ -14,16 +14,26 @@ import os
 import sys
 import time
 import json
+import io
+from collections import Counter
 from typing import List, Optional
 import subprocess
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import random
+import multiprocessing
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # 상위 디렉토리를 path에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pointcloud.circle_environment_generator import create_circle_environment
 from pointcloud import PointcloudExtractor
+from ply_io import encode_ply_points
 
 
 def parse_args():
@@ -80,6 +90,24 @@ def parse_args():
     return parser.parse_args()
 
 
+# 워커 프로세스별 PointcloudExtractor (initializer에서 한 번만 생성)
+_EXTRACTOR = None
+
+
+def _init_worker(resolution: float, noise_level: float, output_dir: str, workspace_bounds: tuple,
+                 save_images: bool = False):
+    """워커 프로세스 초기화 - 추출기, 스캔 그리드, (옵션) 이미지용 Figure를 프로세스당 한 번 생성"""
+    global _EXTRACTOR
+    _EXTRACTOR = PointcloudExtractor(
+        resolution=resolution,
+        noise_level=noise_level,
+        data_dir=output_dir
+    )
+    _EXTRACTOR.get_scan_grid(workspace_bounds)
+    if save_images:
+        _get_image_axes()
+
+
 def generate_single_environment(args: tuple) -> dict:
     """단일 환경 생성 (멀티프로세싱용)"""
     (index, difficulty, seed, output_dir, 
@@ -102,14 +130,13 @@ def generate_single_environment(args: tuple) -> dict:
                 'filename': None
             }
         
-        # 포인트클라우드 추출
-        extractor = PointcloudExtractor(
-            resolution=resolution,
-            noise_level=noise_level,
-            data_dir=output_dir
-        )
+        # 포인트클라우드 추출 (initializer 없이 호출된 경우 여기서 생성)
+        if _EXTRACTOR is None:
+            _init_worker(resolution, noise_level, output_dir, workspace_bounds, save_images)
+        extractor = _EXTRACTOR
         
-        points = extractor.extract_from_world(world, workspace_bounds)
+        # 노이즈도 환경 시드로 재현 가능하도록 (환경 생성기는 전역 난수 상태를 시드하지 않음)
+        points = extractor.extract_from_world(world, workspace_bounds, rng=np.random.default_rng(seed))
         
         if len(points) == 0:
             return {
@@ -138,17 +165,17 @@ def generate_single_environment(args: tuple) -> dict:
             'environment_details': environment_metadata
         }
         
-        # 저장
-        ply_path = extractor.save_pointcloud(points, filename, metadata=metadata)
+        # 파일 쓰기는 메인 프로세스에서 순차적으로 처리하도록 바이트로 인코딩해서 반환
+        ply_bytes = encode_ply_points(points)
         
-        # 이미지 저장 (옵션)
+        # 이미지 렌더링 (옵션)
+        image_bytes = None
         if save_images:
             try:
-                save_environment_image(world, obstacles, filename, 
-                                     workspace_bounds, output_dir)
+                image_bytes = render_environment_image(obstacles, filename, workspace_bounds)
             except Exception as e:
                 # 이미지 저장 실패는 치명적이지 않음
-                pass
+                print(f"Failed to render image for {filename}: {e}")
         
         return {
             'index': index,
@@ -158,7 +185,10 @@ def generate_single_environment(args: tuple) -> dict:
             'obstacles': len(obstacles),
             'points': len(points),
             'difficulty': difficulty,
-            'config': environment_metadata.get('config', {})
+            'config': environment_metadata.get('config', {}),
+            'metadata': metadata,
+            'ply_bytes': ply_bytes,
+            'image_bytes': image_bytes
         }
         
     except Exception as e:
@@ -170,48 +200,62 @@ def generate_single_environment(args: tuple) -> dict:
         }
 
 
-def save_environment_image(world, obstacles, filename: str, workspace_bounds, output_dir: str):
-    """환경 이미지 저장"""
-    try:
-        import matplotlib.pyplot as plt
-        import matplotlib.patches as patches
-        
-        fig, ax = plt.subplots(1, 1, figsize=(10, 8))
-        
-        # 작업공간 경계 설정
-        min_x, max_x, min_y, max_y = workspace_bounds
-        ax.set_xlim(min_x, max_x)
-        ax.set_ylim(min_y, max_y)
-        ax.set_aspect('equal')
-        
-        # 로봇 베이스 표시
-        ax.plot(0, 0, 'ro', markersize=8, label='Robot Base')
-        
-        # 장애물 그리기
-        for obstacle in obstacles:
-            if obstacle.fixtures:
-                fixture = obstacle.fixtures[0]
-                pos = obstacle.position
-                
-                if hasattr(fixture.shape, 'radius'):
-                    # 원형 장애물
-                    circle = patches.Circle((pos.x, pos.y), fixture.shape.radius,
-                                          facecolor='lightblue', edgecolor='darkblue', alpha=0.7)
-                    ax.add_patch(circle)
-        
-        ax.set_title(f'Circle Environment: {filename}')
-        ax.set_xlabel('X (m)')
-        ax.set_ylabel('Y (m)')
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-        
-        # 이미지 저장
-        image_path = os.path.join(output_dir, f"{filename}_scene.jpg")
-        plt.savefig(image_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        
-    except Exception as e:
-        print(f"Failed to save image for {filename}: {e}")
+# 워커 프로세스별로 재사용하는 Figure/Axes와 matplotlib 클래스
+# (--save-images일 때 워커 초기화에서 한 번만 import/생성)
+_FIG = None
+_AX = None
+_EllipseCollection = None
+
+
+def _get_image_axes():
+    """이미지 저장용 Figure/Axes를 한 번만 생성하고 이후에는 비워서 재사용"""
+    global _FIG, _AX, _EllipseCollection
+    if _FIG is None:
+        # pyplot 상태/GUI 백엔드 없이 Agg 캔버스에 직접 그림
+        from matplotlib.figure import Figure
+        from matplotlib.collections import EllipseCollection
+        _EllipseCollection = EllipseCollection
+        _FIG = Figure(figsize=(10, 8))
+        _AX = _FIG.add_subplot(1, 1, 1)
+    else:
+        _AX.clear()
+    return _FIG, _AX
+
+
+def render_environment_image(obstacles, filename: str, workspace_bounds) -> bytes:
+    """환경 이미지를 JPEG 바이트로 렌더링"""
+    fig, ax = _get_image_axes()
+    
+    # 작업공간 경계 설정
+    min_x, max_x, min_y, max_y = workspace_bounds
+    ax.set_xlim(min_x, max_x)
+    ax.set_ylim(min_y, max_y)
+    ax.set_aspect('equal')
+    
+    # 로봇 베이스 표시
+    ax.plot(0, 0, 'ro', markersize=8, label='Robot Base')
+    
+    # 장애물 그리기 (원형 장애물을 하나의 컬렉션으로 묶어 한 번에 추가)
+    circles = [(obstacle.position.x, obstacle.position.y, obstacle.fixtures[0].shape.radius)
+               for obstacle in obstacles
+               if obstacle.fixtures and hasattr(obstacle.fixtures[0].shape, 'radius')]
+    if circles:
+        circles = np.asarray(circles)
+        diameters = 2 * circles[:, 2]
+        ax.add_collection(_EllipseCollection(
+            widths=diameters, heights=diameters, angles=0, units='xy',
+            offsets=circles[:, :2], offset_transform=ax.transData,
+            facecolors='lightblue', edgecolors='darkblue', alpha=0.7))
+    
+    ax.set_title(f'Circle Environment: {filename}')
+    ax.set_xlabel('X (m)')
+    ax.set_ylabel('Y (m)')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='jpg', dpi=150, bbox_inches='tight')
+    return buffer.getvalue()
 
 
 def main():
@@ -240,16 +284,19 @@ def main():
         # 가중치가 맞지 않으면 균등 분포 사용
         args.difficulty_weights = [1.0 / len(args.difficulties)] * len(args.difficulties)
     
+    # 난이도 선택 (가중치 적용, 전체 count를 한 번에 샘플링)
+    weights = np.asarray(args.difficulty_weights, dtype=np.float64)
+    rng = np.random.default_rng(args.seed_base)
+    difficulties = rng.choice(args.difficulties, size=args.count, p=weights / weights.sum()).tolist()
+    
     # 각 환경에 대한 설정 생성
     tasks = []
-    for i in range(args.count):
+    for i, difficulty in enumerate(difficulties):
         index = args.start_index + i
         
-        # 난이도 선택 (가중치 적용)
-        difficulty = random.choices(args.difficulties, weights=args.difficulty_weights)[0]
-        
-        # 시드 생성 (재현 가능하도록)
-        seed = args.seed_base + index
+        # 시드 생성 (재현 가능하도록) - seed_base와 index만으로 결정되는 독립 스트림에서 파생,
+        # 인접 index 간 상관된 시퀀스를 피함 (start_index/count와 무관하게 같은 index는 같은 시드)
+        seed = int(np.random.SeedSequence(args.seed_base, spawn_key=(index,)).generate_state(1)[0])
         
         task_args = (
             index, difficulty, seed, output_dir,
@@ -266,36 +313,64 @@ def main():
     completed = 0
     success_count = 0
     failed_envs = []
-    difficulty_stats = {d: 0 for d in args.difficulties}
+    difficulty_counts = Counter()
+    next_report = min(args.batch_size, len(tasks))  # 다음 진행 상황 출력 지점
+    
+    # 워커가 반환한 PLY/메타데이터/이미지는 메인 프로세스에서만 순차적으로 기록
+    writer = PointcloudExtractor(
+        resolution=args.resolution,
+        noise_level=args.noise_level,
+        data_dir=output_dir
+    )
+    
+    # 멀티프로세싱으로 생성 - Linux에서는 fork로 워커를 띄워 이미 import된 모듈
+    # (Box2D, numpy, 환경 생성기 등)을 copy-on-write로 상속 (spawn의 워커별 재import 비용 제거)
+    if sys.platform.startswith('linux'):
+        mp_context = multiprocessing.get_context('fork')
+    else:
+        mp_context = multiprocessing.get_context()
     
-    # 멀티프로세싱으로 생성
-    with ProcessPoolExecutor(max_workers=args.parallel) as executor:
-        # 작업 제출
-        future_to_index = {executor.submit(generate_single_environment, task): task[0] 
-                          for task in tasks}
+    with mp_context.Pool(args.parallel, initializer=_init_worker,
+                         initargs=(args.resolution, args.noise_level, output_dir,
+                                   tuple(args.workspace_bounds), args.save_images)) as pool:
+        # 작업을 청크 단위로 묶어 스트리밍 (태스크당 pickle/IPC 오버헤드 분산,
+        # 청크 크기를 제한해서 대기 중인 결과가 메모리에 쌓이지 않도록 함)
+        chunksize = min(64, max(1, len(tasks) // (args.parallel * 8)))
         
-        # 결과 수집
-        for future in as_completed(future_to_index):
-            result = future.result()
-            completed += 1
-            
+        # 결과 수집 (완료 순서대로)
+        for completed, result in enumerate(
+                pool.imap_unordered(generate_single_environment, tasks, chunksize=chunksize), 1):
             if result['success']:
-                success_count += 1
-                difficulty_stats[result['difficulty']] += 1
+                writer.save_encoded_pointcloud(result.pop('ply_bytes'), result['filename'],
+                                               metadata=result.pop('metadata'))
+                image_bytes = result.pop('image_bytes')
+                if image_bytes is not None:
+                    image_path = os.path.join(output_dir, f"{result['filename']}_scene.jpg")
+                    with open(image_path, 'wb') as f:
+                        f.write(image_bytes)
                 
-                if completed % args.batch_size == 0 or completed == len(tasks):
-                    elapsed = time.time() - start_time
-                    rate = completed / elapsed
-                    eta = (len(tasks) - completed) / rate if rate > 0 else 0
-                    
-                    print(f"Progress: {completed}/{len(tasks)} ({completed/len(tasks)*100:.1f}%) "
-                          f"- Success: {success_count} - Rate: {rate:.1f} env/s - ETA: {eta:.0f}s")
+                difficulty_counts[result['difficulty']] += 1
             else:
+                # 실패는 모아두었다가 진행 상황/최종 요약에서 한꺼번에 출력
                 failed_envs.append({
                     'index': result['index'],
                     'error': result['error']
                 })
-                print(f"Failed env_{result['index']:06d}: {result['error']}")
+            
+            # 출력 지점에서만 통계/ETA 계산
+            if completed == next_report:
+                next_report = min(next_report + args.batch_size, len(tasks))
+                success_count = completed - len(failed_envs)
+                elapsed = time.time() - start_time
+                rate = completed / elapsed
+                eta = (len(tasks) - completed) / rate if rate > 0 else 0
+                
+                print(f"Progress: {completed}/{len(tasks)} ({completed/len(tasks)*100:.1f}%) "
+                      f"- Success: {success_count} - Failed: {len(failed_envs)} "
+                      f"- Rate: {rate:.1f} env/s - ETA: {eta:.0f}s")
+    
+    success_count = completed - len(failed_envs)
+    difficulty_stats = {d: difficulty_counts[d] for d in args.difficulties}
     
     # 결과 요약
     total_time = time.time() - start_time
@@ -340,8 +415,12 @@ def main():
     }
     
     summary_path = os.path.join(output_dir, 'generation_summary.json')
-    with open(summary_path, 'w') as f:
-        json.dump(summary, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(summary_path, 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(summary_path, 'w') as f:
+            json.dump(summary, f, indent=2)
     
     print(f"\nSummary saved to: {summary_path}")
     print(f"Environments saved in: {output_dir}")
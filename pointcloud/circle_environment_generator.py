@@ -17,10 +17,29 @@ import random
 from typing import List, Tuple, Dict, Optional
 from Box2D.b2 import world, staticBody
 from enum import Enum
+from collections import defaultdict
 import dataclasses
+import functools
+import logging
+import itertools
+from types import MappingProxyType
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-@dataclasses.dataclass
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
 class EnvironmentConfig:
     """환경 설정 클래스"""
     num_obstacles: int
@@ -32,9 +51,222 @@ class EnvironmentConfig:
     min_distance_factor: float  # 장애물 간 최소 거리 배수
 
 
+# 메타데이터용 필드 이름 (dataclasses.asdict의 재귀 복사 대신 얕은 dict 생성)
+_CONFIG_FIELDS = tuple(f.name for f in dataclasses.fields(EnvironmentConfig))
+
+
+if NUMBA_AVAILABLE:
+    # cache=True는 쓰지 않음: 이 모듈은 'circle_environment_generator'/'pointcloud.circle_environment_generator'
+    # 두 이름으로 import되는데, 디스크 캐시는 모듈 이름을 기록해서 다른 이름으로 로드하면 실패함
+    @njit
+    def _accept_candidates_nb(candidates, accepted, count, limit, base_x, base_y, robot_sq, min_d2):
+        """
+        후보 배열을 순서대로 검사해 유효한 위치를 accepted[count:]에 greedy하게 채택
+        (로봇 베이스 거리 + 채택된 위치들과의 최소 거리), 새 count 반환
+        """
+        for i in range(candidates.shape[0]):
+            if count >= limit:
+                break
+            x = candidates[i, 0]
+            y = candidates[i, 1]
+            dx = x - base_x
+            dy = y - base_y
+            if dx * dx + dy * dy < robot_sq:
+                continue
+            valid = True
+            for j in range(count):
+                dx = x - accepted[j, 0]
+                dy = y - accepted[j, 1]
+                if dx * dx + dy * dy < min_d2:
+                    valid = False
+                    break
+            if valid:
+                accepted[count, 0] = x
+                accepted[count, 1] = y
+                count += 1
+        return count
+
+
+# 고급 난이도 시스템 정의 (모든 생성기 인스턴스가 공유하는 읽기 전용 상수)
+
+# 1. 장애물 개수별 난이도 레벨
+_OBSTACLE_COUNT_LEVELS = MappingProxyType({
+    'minimal': (2, 4),      # 최소한의 장애물
+    'few': (3, 6),          # 적은 장애물
+    'light': (5, 8),        # 가벼운 수준
+    'moderate': (7, 12),    # 보통 수준
+    'busy': (10, 16),       # 바쁜 수준
+    'crowded': (14, 20),    # 혼잡한 수준
+    'dense': (18, 25),      # 조밀한 수준
+    'packed': (22, 30),     # 빽빽한 수준
+})
+
+# 2. 장애물 크기별 카테고리
+_SIZE_CATEGORIES = MappingProxyType({
+    'tiny': (0.1, 0.2),      # 아주 작은
+    'small': (0.15, 0.35),   # 작은
+    'medium_small': (0.25, 0.45),  # 중간-작은
+    'medium': (0.35, 0.65),  # 중간
+    'medium_large': (0.5, 0.8),   # 중간-큰
+    'large': (0.7, 1.0),     # 큰
+    'huge': (0.9, 1.3),      # 아주 큰
+    'mixed_small': (0.1, 0.5),     # 작은 것들 혼합
+    'mixed_medium': (0.2, 0.8),    # 중간 크기들 혼합
+    'mixed_large': (0.4, 1.2),     # 큰 것들 혼합
+    'mixed_all': (0.1, 1.0),       # 모든 크기 혼합
+})
+
+# 3. 배치 밀도별 파라미터
+_DENSITY_PARAMS = MappingProxyType({
+    'sparse': MappingProxyType({
+        'min_distance_factor': 2.0,
+        'max_attempts': 100,
+        'workspace_utilization': 0.4
+    }),
+    'medium': MappingProxyType({
+        'min_distance_factor': 1.2,
+        'max_attempts': 80,
+        'workspace_utilization': 0.6
+    }),
+    'dense': MappingProxyType({
+        'min_distance_factor': 0.5,
+        'max_attempts': 60,
+        'workspace_utilization': 0.8
+    })
+})
+
+# 4. 복잡도별 파라미터
+_COMPLEXITY_PARAMS = MappingProxyType({
+    'simple': MappingProxyType({
+        'clustering_factor': 0.2,    # 클러스터링 정도
+        'size_variation': 0.3,       # 크기 변화량
+        'overlap_tolerance': 0.1     # 겹침 허용도
+    }),
+    'medium': MappingProxyType({
+        'clustering_factor': 0.5,
+        'size_variation': 0.5,
+        'overlap_tolerance': 0.2
+    }),
+    'complex': MappingProxyType({
+        'clustering_factor': 0.8,
+        'size_variation': 0.8,
+        'overlap_tolerance': 0.3
+    })
+})
+
+# 5. 공간 활용 패턴
+_SPATIAL_PATTERNS = MappingProxyType({
+    'center': 'concentrate_center',
+    'distributed': 'uniform_random',
+    'edge': 'concentrate_edges',
+    'clusters': 'multiple_clusters',
+    'line': 'linear_arrangement',
+    'arc': 'arc_arrangement'
+})
+
+# 랜덤 설정에서 고르는 키 목록 (매 호출마다 list(keys()) 생성 방지)
+_COUNT_LEVEL_KEYS = tuple(_OBSTACLE_COUNT_LEVELS)
+_SIZE_CATEGORY_KEYS = tuple(_SIZE_CATEGORIES)
+_SPATIAL_PATTERN_KEYS = tuple(_SPATIAL_PATTERNS)
+
+# 장애물 개수 레벨 가중치 (minimal ~ packed)의 누적합 - random.choices가 매번 누적합을 다시 계산하지 않도록
+_COUNT_CUM_WEIGHTS = tuple(itertools.accumulate([0.1, 0.2, 0.3, 0.25, 0.1, 0.03, 0.015, 0.005]))
+
+# 밀도별 기본 최소 거리 계수
+_DENSITY_TO_DISTANCE = MappingProxyType({'sparse': 2.0, 'medium': 1.2, 'dense': 0.6})
+
+
+@functools.lru_cache(maxsize=None)
+def _tutorial_config() -> EnvironmentConfig:
+    """tutorial 난이도 설정 (랜덤 요소 없음 - 한 번만 생성해서 공유)"""
+    return EnvironmentConfig(
+        num_obstacles=3,
+        obstacle_size_range=(0.2, 0.4),
+        density_level='sparse',
+        complexity_level='simple',
+        spatial_distribution='center',
+        workspace_utilization=0.3,
+        min_distance_factor=2.0
+    )
+
+
+class _BatchRNG:
+    """numpy generator에서 난수를 버퍼 단위로 미리 뽑아두고 스칼라로 하나씩 꺼내 쓰는 헬퍼"""
+    
+    def __init__(self, rng: np.random.Generator, size: int = 1000):
+        self._rng = rng
+        self._size = size
+        self._buf = rng.random(size).tolist()
+        self._idx = 0
+    
+    def random(self) -> float:
+        """[0, 1) 균등 난수"""
+        if self._idx >= self._size:
+            self._buf = self._rng.random(self._size).tolist()
+            self._idx = 0
+        value = self._buf[self._idx]
+        self._idx += 1
+        return value
+    
+    def uniform(self, a: float, b: float) -> float:
+        """random.uniform과 같은 [a, b) 균등 난수"""
+        return a + (b - a) * self.random()
+    
+    def randint(self, a: int, b: int) -> int:
+        """random.randint와 같은 [a, b] 정수 난수"""
+        return a + int(self.random() * (b - a + 1))
+
+
+class _PositionGrid:
+    """장애물 간 최소 거리 검사용 균일 격자 (셀 크기 = 최소 거리 → 주변 3x3 셀만 확인)"""
+    
+    def __init__(self, min_distance: float):
+        self.min_d2 = min_distance**2
+        self._cell = min_distance if min_distance > 0 else None
+        self._cells = defaultdict(list)
+    
+    def _key(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self._cell), math.floor(y / self._cell)
+    
+    def add(self, x: float, y: float):
+        if self._cell is not None:
+            self._cells[self._key(x, y)].append((x, y))
+    
+    def is_clear(self, x: float, y: float) -> bool:
+        """기존 위치들과 모두 최소 거리 이상 떨어져 있는지 확인"""
+        cell = self._cell
+        if cell is None:
+            return True
+        
+        min_d2 = self.min_d2
+        kx = math.floor(x / cell)
+        ky = math.floor(y / cell)
+        get = self._cells.get
+        for ix in (kx - 1, kx, kx + 1):
+            for iy in (ky - 1, ky, ky + 1):
+                neighbors = get((ix, iy))
+                if neighbors:
+                    for ex, ey in neighbors:
+                        dx = x - ex
+                        dy = y - ey
+                        if dx * dx + dy * dy < min_d2:
+                            return False
+        return True
+
+
 class CircleEnvironmentGenerator:
     """원형 장애물 전용 환경 생성기"""
     
+    # 위치 후보를 한 번에 뽑는 배치 크기 (패턴별 최대 시도 횟수 안에서 반복)
+    _CANDIDATE_BATCH = 256
+    
+    # 난이도 매트릭스 (모듈 상수 공유)
+    obstacle_count_levels = _OBSTACLE_COUNT_LEVELS
+    size_categories = _SIZE_CATEGORIES
+    density_params = _DENSITY_PARAMS
+    complexity_params = _COMPLEXITY_PARAMS
+    spatial_patterns = _SPATIAL_PATTERNS
+    
     def __init__(self, 
                  workspace_bounds: Tuple[float, float, float, float] = (0, 10, 0, 8),
                  robot_base_pos: Tuple[float, float] = (0, 0),
@@ -51,9 +283,14 @@ class CircleEnvironmentGenerator:
         self.robot_base_pos = robot_base_pos
         self.robot_max_reach = robot_max_reach
         
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
+        # 로봇 주변 1.5m는 비워둠 (제곱 거리로 비교)
+        self._robot_clear_sq = 1.5**2
+        
+        # 인스턴스 전용 난수 생성기 (전역 random/np.random 상태는 건드리지 않음)
+        # 위치 후보 배치 샘플링용 generator와 스칼라 난수 버퍼, 목록 선택용 random.Random
+        self._rng = np.random.default_rng(seed)
+        self._batch_rng = _BatchRNG(self._rng)
+        self._py_rng = random.Random(seed)
         
         # 장애물 생성 범위 설정 (로봇 주변 여유공간 확보)
         min_x, max_x, min_y, max_y = workspace_bounds
@@ -63,174 +300,84 @@ class CircleEnvironmentGenerator:
             min_y + 0.5,
             max_y - 0.5
         )
-        
-        # 난이도 매트릭스 정의
-        self._init_difficulty_system()
     
-    def _init_difficulty_system(self):
-        """고급 난이도 시스템 초기화"""
-        
-        # 1. 장애물 개수별 난이도 레벨
-        self.obstacle_count_levels = {
-            'minimal': (2, 4),      # 최소한의 장애물
-            'few': (3, 6),          # 적은 장애물
-            'light': (5, 8),        # 가벼운 수준
-            'moderate': (7, 12),    # 보통 수준
-            'busy': (10, 16),       # 바쁜 수준
-            'crowded': (14, 20),    # 혼잡한 수준
-            'dense': (18, 25),      # 조밀한 수준
-            'packed': (22, 30),     # 빽빽한 수준
-        }
-        
-        # 2. 장애물 크기별 카테고리
-        self.size_categories = {
-            'tiny': (0.1, 0.2),      # 아주 작은
-            'small': (0.15, 0.35),   # 작은
-            'medium_small': (0.25, 0.45),  # 중간-작은
-            'medium': (0.35, 0.65),  # 중간
-            'medium_large': (0.5, 0.8),   # 중간-큰
-            'large': (0.7, 1.0),     # 큰
-            'huge': (0.9, 1.3),      # 아주 큰
-            'mixed_small': (0.1, 0.5),     # 작은 것들 혼합
-            'mixed_medium': (0.2, 0.8),    # 중간 크기들 혼합
-            'mixed_large': (0.4, 1.2),     # 큰 것들 혼합
-            'mixed_all': (0.1, 1.0),       # 모든 크기 혼합
-        }
-        
-        # 3. 배치 밀도별 파라미터
-        self.density_params = {
-            'sparse': {
-                'min_distance_factor': 2.0,
-                'max_attempts': 100,
-                'workspace_utilization': 0.4
-            },
-            'medium': {
-                'min_distance_factor': 1.2,
-                'max_attempts': 80,
-                'workspace_utilization': 0.6
-            },
-            'dense': {
-                'min_distance_factor': 0.5,
-                'max_attempts': 60,
-                'workspace_utilization': 0.8
-            }
-        }
-        
-        # 4. 복잡도별 파라미터
-        self.complexity_params = {
-            'simple': {
-                'clustering_factor': 0.2,    # 클러스터링 정도
-                'size_variation': 0.3,       # 크기 변화량
-                'overlap_tolerance': 0.1     # 겹침 허용도
-            },
-            'medium': {
-                'clustering_factor': 0.5,
-                'size_variation': 0.5,
-                'overlap_tolerance': 0.2
-            },
-            'complex': {
-                'clustering_factor': 0.8,
-                'size_variation': 0.8,
-                'overlap_tolerance': 0.3
-            }
-        }
-        
-        # 5. 공간 활용 패턴
-        self.spatial_patterns = {
-            'center': 'concentrate_center',
-            'distributed': 'uniform_random',
-            'edge': 'concentrate_edges',
-            'clusters': 'multiple_clusters',
-            'line': 'linear_arrangement',
-            'arc': 'arc_arrangement'
-        }
+    # 난이도별 설정 생성 함수 (선택된 난이도만 생성, tutorial은 랜덤 요소가 없어 캐시)
+    _PREDEFINED_CONFIGS = {
+        'tutorial': lambda gen: _tutorial_config(),
+        'easy': lambda gen: EnvironmentConfig(
+            num_obstacles=gen._batch_rng.randint(3, 6),
+            obstacle_size_range=gen._py_rng.choice([(0.15, 0.35), (0.25, 0.45)]),
+            density_level='sparse',
+            complexity_level='simple',
+            spatial_distribution=gen._py_rng.choice(['center', 'distributed']),
+            workspace_utilization=0.4,
+            min_distance_factor=1.8
+        ),
+        'medium': lambda gen: EnvironmentConfig(
+            num_obstacles=gen._batch_rng.randint(5, 10),
+            obstacle_size_range=gen._py_rng.choice([(0.2, 0.6), (0.3, 0.7)]),
+            density_level='medium',
+            complexity_level='medium',
+            spatial_distribution=gen._py_rng.choice(['distributed', 'clusters']),
+            workspace_utilization=0.6,
+            min_distance_factor=1.2
+        ),
+        'hard': lambda gen: EnvironmentConfig(
+            num_obstacles=gen._batch_rng.randint(8, 16),
+            obstacle_size_range=gen._py_rng.choice([(0.1, 0.8), (0.2, 1.0)]),
+            density_level='dense',
+            complexity_level='complex',
+            spatial_distribution=gen._py_rng.choice(['distributed', 'clusters', 'edge']),
+            workspace_utilization=0.8,
+            min_distance_factor=0.8
+        ),
+        'expert': lambda gen: EnvironmentConfig(
+            num_obstacles=gen._batch_rng.randint(12, 25),
+            obstacle_size_range=(0.1, 1.2),
+            density_level='dense',
+            complexity_level='complex',
+            spatial_distribution=gen._py_rng.choice(['clusters', 'edge', 'line']),
+            workspace_utilization=0.9,
+            min_distance_factor=0.5
+        ),
+    }
     
     def generate_predefined_difficulty_config(self, difficulty_name: str) -> EnvironmentConfig:
         """미리 정의된 난이도별 설정 생성"""
         
-        predefined_configs = {
-            'tutorial': EnvironmentConfig(
-                num_obstacles=3,
-                obstacle_size_range=(0.2, 0.4),
-                density_level='sparse',
-                complexity_level='simple',
-                spatial_distribution='center',
-                workspace_utilization=0.3,
-                min_distance_factor=2.0
-            ),
-            'easy': EnvironmentConfig(
-                num_obstacles=random.randint(3, 6),
-                obstacle_size_range=random.choice([(0.15, 0.35), (0.25, 0.45)]),
-                density_level='sparse',
-                complexity_level='simple',
-                spatial_distribution=random.choice(['center', 'distributed']),
-                workspace_utilization=0.4,
-                min_distance_factor=1.8
-            ),
-            'medium': EnvironmentConfig(
-                num_obstacles=random.randint(5, 10),
-                obstacle_size_range=random.choice([(0.2, 0.6), (0.3, 0.7)]),
-                density_level='medium',
-                complexity_level='medium',
-                spatial_distribution=random.choice(['distributed', 'clusters']),
-                workspace_utilization=0.6,
-                min_distance_factor=1.2
-            ),
-            'hard': EnvironmentConfig(
-                num_obstacles=random.randint(8, 16),
-                obstacle_size_range=random.choice([(0.1, 0.8), (0.2, 1.0)]),
-                density_level='dense',
-                complexity_level='complex',
-                spatial_distribution=random.choice(['distributed', 'clusters', 'edge']),
-                workspace_utilization=0.8,
-                min_distance_factor=0.8
-            ),
-            'expert': EnvironmentConfig(
-                num_obstacles=random.randint(12, 25),
-                obstacle_size_range=(0.1, 1.2),
-                density_level='dense',
-                complexity_level='complex',
-                spatial_distribution=random.choice(['clusters', 'edge', 'line']),
-                workspace_utilization=0.9,
-                min_distance_factor=0.5
-            )
-        }
-        
-        if difficulty_name not in predefined_configs:
+        if difficulty_name not in self._PREDEFINED_CONFIGS:
             difficulty_name = 'medium'  # 기본값
         
-        return predefined_configs[difficulty_name]
+        return self._PREDEFINED_CONFIGS[difficulty_name](self)
     
     def generate_random_config(self) -> EnvironmentConfig:
         """완전 랜덤한 환경 설정 생성"""
         
         # 랜덤 장애물 개수 (가중치 적용)
-        count_weights = [0.1, 0.2, 0.3, 0.25, 0.1, 0.03, 0.015, 0.005]  # minimal ~ packed
-        count_level = random.choices(list(self.obstacle_count_levels.keys()), weights=count_weights)[0]
-        num_obstacles = random.randint(*self.obstacle_count_levels[count_level])
+        count_level = self._py_rng.choices(_COUNT_LEVEL_KEYS, cum_weights=_COUNT_CUM_WEIGHTS)[0]
+        num_obstacles = self._batch_rng.randint(*self.obstacle_count_levels[count_level])
         
         # 랜덤 크기 범위
-        size_category = random.choice(list(self.size_categories.keys()))
+        size_category = self._py_rng.choice(_SIZE_CATEGORY_KEYS)
         obstacle_size_range = self.size_categories[size_category]
         
         # 랜덤 밀도
-        density_level = random.choice(['sparse', 'medium', 'dense'])
+        density_level = self._py_rng.choice(['sparse', 'medium', 'dense'])
         
         # 랜덤 복잡도
-        complexity_level = random.choice(['simple', 'medium', 'complex'])
+        complexity_level = self._py_rng.choice(['simple', 'medium', 'complex'])
         
         # 랜덤 공간 분포
-        spatial_distribution = random.choice(list(self.spatial_patterns.keys()))
+        spatial_distribution = self._py_rng.choice(_SPATIAL_PATTERN_KEYS)
         
         # 작업공간 활용도 (장애물 개수와 상관관계)
         base_utilization = min(0.3 + (num_obstacles - 2) * 0.03, 0.9)
-        workspace_utilization = base_utilization + random.uniform(-0.1, 0.1)
+        workspace_utilization = base_utilization + self._batch_rng.uniform(-0.1, 0.1)
         workspace_utilization = max(0.2, min(0.95, workspace_utilization))
         
         # 최소 거리 계수 (밀도와 반비례)
-        density_to_distance = {'sparse': 2.0, 'medium': 1.2, 'dense': 0.6}
-        base_distance_factor = density_to_distance[density_level]
-        min_distance_factor = base_distance_factor + random.uniform(-0.3, 0.3)
+        base_distance_factor = _DENSITY_TO_DISTANCE[density_level]
+        min_distance_factor = base_distance_factor + self._batch_rng.uniform(-0.3, 0.3)
         min_distance_factor = max(0.1, min(3.0, min_distance_factor))
         
         return EnvironmentConfig(
@@ -243,59 +390,80 @@ class CircleEnvironmentGenerator:
             min_distance_factor=min_distance_factor
         )
     
-    def generate_environment_from_config(self, config: EnvironmentConfig) -> Tuple[world, List, Dict]:
-        """설정에 따른 환경 생성"""
+    def generate_environment_from_config(self, config: EnvironmentConfig,
+                                         build_world: bool = True) -> Tuple[Optional[world], List, Dict]:
+        """
+        설정에 따른 환경 생성
         
-        print(f"Generating environment with config:")
-        print(f"  - Obstacles: {config.num_obstacles}")
-        print(f"  - Size range: {config.obstacle_size_range}")
-        print(f"  - Density: {config.density_level}")
-        print(f"  - Complexity: {config.complexity_level}")
-        print(f"  - Distribution: {config.spatial_distribution}")
+        build_world=False면 Box2D 월드를 만들지 않고 (None, (N, 3) [x, y, radius] 배열, metadata) 반환
+        (지오메트리만 필요한 대량 생성용)
+        """
+        
+        # 대량 생성 시 환경마다 stdout 출력하지 않도록 DEBUG 레벨에서만 기록
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Generating environment with config:")
+            log.debug(f"  - Obstacles: {config.num_obstacles}")
+            log.debug(f"  - Size range: {config.obstacle_size_range}")
+            log.debug(f"  - Density: {config.density_level}")
+            log.debug(f"  - Complexity: {config.complexity_level}")
+            log.debug(f"  - Distribution: {config.spatial_distribution}")
         
         # 월드 생성
-        W = world(gravity=(0, 0), doSleep=True)
+        W = world(gravity=(0, 0), doSleep=True) if build_world else None
         obstacles = []
+        geometry = []  # 생성된 장애물의 (x, y, radius)
         
         # 위치 생성 방법 선택
         positions = self._generate_positions_by_pattern(config)
         
+        # 크기 결정 (복잡도에 따라 변화량 조정)
+        size_variation = self.complexity_params[config.complexity_level]['size_variation']
+        
         # 장애물 생성
-        for i, position in enumerate(positions):
-            if i >= config.num_obstacles:
-                break
-            
-            # 크기 결정 (복잡도에 따라 변화량 조정)
-            complexity_params = self.complexity_params[config.complexity_level]
-            size_variation = complexity_params['size_variation']
-            
-            base_size = random.uniform(*config.obstacle_size_range)
-            variation = random.uniform(-size_variation, size_variation) * base_size
+        for i, position in enumerate(positions.tolist()):
+            base_size = self._batch_rng.uniform(*config.obstacle_size_range)
+            variation = self._batch_rng.uniform(-size_variation, size_variation) * base_size
             radius = max(0.05, base_size + variation)
             
+            if W is None:
+                geometry.append((position[0], position[1], radius))
+                continue
+            
             try:
                 obstacle = self._create_circle_obstacle(W, position, radius)
                 if obstacle:
                     obstacles.append(obstacle)
+                    geometry.append((position[0], position[1], radius))
             except Exception as e:
-                print(f"Failed to create obstacle {i}: {e}")
+                log.warning(f"Failed to create obstacle {i}: {e}")
                 continue
         
+        geometry = np.array(geometry, dtype=np.float64).reshape(-1, 3)
+        
         # 메타데이터 생성
-        metadata = self._generate_metadata(config, obstacles)
+        metadata = self._generate_metadata(config, geometry)
         
-        print(f"Successfully created {len(obstacles)} obstacles")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Successfully created {len(geometry)} obstacles")
+        if W is None:
+            return None, geometry, metadata
         return W, obstacles, metadata
     
-    def _generate_positions_by_pattern(self, config: EnvironmentConfig) -> List[Tuple[float, float]]:
-        """공간 분포 패턴에 따른 위치 생성"""
+    def _generate_positions_by_pattern(self, config: EnvironmentConfig) -> np.ndarray:
+        """공간 분포 패턴에 따른 위치 생성 -> (N, 2) 배열"""
         
         min_x, max_x, min_y, max_y = self.obstacle_bounds
         pattern = config.spatial_distribution
         
-        positions = []
+        # 채택된 위치는 미리 할당한 배열의 앞쪽 count개 (positions[:count])
+        positions = np.empty((config.num_obstacles, 2), dtype=np.float64)
+        count = 0
         max_attempts = 1000
         
+        # 장애물 간 최소 거리
+        min_distance = config.min_distance_factor * (config.obstacle_size_range[0] + config.obstacle_size_range[1]) / 2
+        min_d2 = min_distance**2
+        
         if pattern == 'center':
             # 중앙 집중
             center_x = (min_x + max_x) / 2
@@ -303,122 +471,140 @@ class CircleEnvironmentGenerator:
             spread_x = (max_x - min_x) * config.workspace_utilization * 0.3
             spread_y = (max_y - min_y) * config.workspace_utilization * 0.3
             
-            for _ in range(max_attempts):
-                if len(positions) >= config.num_obstacles:
-                    break
-                
-                x = center_x + random.uniform(-spread_x, spread_x)
-                y = center_y + random.uniform(-spread_y, spread_y)
-                
-                if self._is_position_valid(x, y, positions, config):
-                    positions.append((x, y))
+            low = (center_x - spread_x, center_y - spread_y)
+            high = (center_x + spread_x, center_y + spread_y)
+            count = self._fill_from_sampler(lambda n: self._rng.uniform(low, high, size=(n, 2)),
+                                            positions, count, min_distance, max_attempts)
         
         elif pattern == 'distributed':
             # 균등 분산
-            for _ in range(max_attempts):
-                if len(positions) >= config.num_obstacles:
-                    break
-                
-                x = random.uniform(min_x, max_x)
-                y = random.uniform(min_y, max_y)
-                
-                if self._is_position_valid(x, y, positions, config):
-                    positions.append((x, y))
+            count = self._fill_from_sampler(lambda n: self._rng.uniform((min_x, min_y), (max_x, max_y), size=(n, 2)),
+                                            positions, count, min_distance, max_attempts)
         
         elif pattern == 'edge':
             # 가장자리 집중
             edge_margin = min((max_x - min_x), (max_y - min_y)) * 0.3
             
-            for _ in range(max_attempts):
-                if len(positions) >= config.num_obstacles:
-                    break
-                
-                # 가장자리 근처 위치 생성
-                edge_choice = random.choice(['left', 'right', 'top', 'bottom'])
-                
-                if edge_choice == 'left':
-                    x = random.uniform(min_x, min_x + edge_margin)
-                    y = random.uniform(min_y, max_y)
-                elif edge_choice == 'right':
-                    x = random.uniform(max_x - edge_margin, max_x)
-                    y = random.uniform(min_y, max_y)
-                elif edge_choice == 'top':
-                    x = random.uniform(min_x, max_x)
-                    y = random.uniform(max_y - edge_margin, max_y)
-                else:  # bottom
-                    x = random.uniform(min_x, max_x)
-                    y = random.uniform(min_y, min_y + edge_margin)
-                
-                if self._is_position_valid(x, y, positions, config):
-                    positions.append((x, y))
+            # 가장자리별 후보 영역 (0: left, 1: right, 2: top, 3: bottom) -> (4, 2) 하한/폭 테이블
+            edge_low = np.array([(min_x, min_y), (max_x - edge_margin, min_y),
+                                 (min_x, max_y - edge_margin), (min_x, min_y)])
+            edge_span = np.array([(edge_margin, max_y - min_y), (edge_margin, max_y - min_y),
+                                  (max_x - min_x, edge_margin), (max_x - min_x, edge_margin)])
+            
+            def sample_edge(n):
+                # 가장자리를 정수로 뽑고 테이블 인덱싱으로 영역 안 균등 위치 생성 (분기 없음)
+                edge_choice = self._rng.integers(0, 4, size=n)
+                return edge_low[edge_choice] + edge_span[edge_choice] * self._rng.random((n, 2))
+            
+            count = self._fill_from_sampler(sample_edge, positions, count, min_distance, max_attempts)
         
         elif pattern == 'clusters':
             # 클러스터 배치
-            num_clusters = random.randint(2, 4)
+            num_clusters = self._batch_rng.randint(2, 4)
             obstacles_per_cluster = config.num_obstacles // num_clusters
             
             # 클러스터 중심 생성
             cluster_centers = []
             for _ in range(num_clusters):
-                cx = random.uniform(min_x + 1, max_x - 1)
-                cy = random.uniform(min_y + 1, max_y - 1)
+                cx = self._batch_rng.uniform(min_x + 1, max_x - 1)
+                cy = self._batch_rng.uniform(min_y + 1, max_y - 1)
                 cluster_centers.append((cx, cy))
             
             # 각 클러스터에 장애물 배치
             for i, (cx, cy) in enumerate(cluster_centers):
-                cluster_radius = random.uniform(0.8, 2.0)
+                cluster_radius = self._batch_rng.uniform(0.8, 2.0)
+                cluster_radius_sq = cluster_radius**2
                 target_count = obstacles_per_cluster + (1 if i < config.num_obstacles % num_clusters else 0)
                 
-                for _ in range(max_attempts // num_clusters):
-                    if len([p for p in positions if self._distance(p, (cx, cy)) < cluster_radius]) >= target_count:
-                        break
-                    
-                    angle = random.uniform(0, 2 * math.pi)
-                    radius = random.uniform(0, cluster_radius)
-                    x = cx + radius * math.cos(angle)
-                    y = cy + radius * math.sin(angle)
-                    
-                    if (min_x <= x <= max_x and min_y <= y <= max_y and 
-                        self._is_position_valid(x, y, positions, config)):
-                        positions.append((x, y))
+                # 제곱 거리로 이미 클러스터 안에 있는 장애물 수 카운트
+                # 새 후보는 모두 클러스터 반경 안이므로 이후엔 채택 개수만큼만 늘어남
+                members = int((((positions[:count] - (cx, cy))**2).sum(axis=1) < cluster_radius_sq).sum())
+                if members >= target_count:
+                    continue
+                
+                def sample_cluster(n, cx=cx, cy=cy, cluster_radius=cluster_radius):
+                    # 원판 내 균일 분포 (반경에 sqrt 적용), 작업공간 밖 후보는 버림
+                    angles = self._rng.uniform(0, 2 * math.pi, size=n)
+                    radii = cluster_radius * np.sqrt(self._rng.random(n))
+                    candidates = np.column_stack((cx + radii * np.cos(angles), cy + radii * np.sin(angles)))
+                    in_bounds = ((candidates[:, 0] >= min_x) & (candidates[:, 0] <= max_x) &
+                                 (candidates[:, 1] >= min_y) & (candidates[:, 1] <= max_y))
+                    return candidates[in_bounds]
+                
+                count = self._fill_from_sampler(sample_cluster, positions, count, min_distance,
+                                                max_attempts // num_clusters,
+                                                limit=count + target_count - members)
         
         # 목표 개수에 못 미치면 균등 분산으로 채움
-        while len(positions) < config.num_obstacles:
-            for _ in range(100):
-                x = random.uniform(min_x, max_x)
-                y = random.uniform(min_y, max_y)
-                
-                if self._is_position_valid(x, y, positions, config):
-                    positions.append((x, y))
-                    break
-            else:
+        # (한 개당 후보 100개를 한 번에 뽑아 제곱 거리로 검사하고 첫 번째 유효 후보 채택)
+        base = np.asarray(self.robot_base_pos, dtype=np.float64)
+        while count < config.num_obstacles:
+            candidates = self._rng.uniform((min_x, min_y), (max_x, max_y), size=(100, 2))
+            valid = ((candidates - base)**2).sum(axis=1) >= self._robot_clear_sq
+            if count:
+                d2 = ((candidates[:, None, :] - positions[None, :count, :])**2).sum(axis=-1)
+                valid &= (d2 >= min_d2).all(axis=1)
+            
+            if not valid.any():
                 break  # 더 이상 배치할 수 없음
+            
+            positions[count] = candidates[valid.argmax()]
+            count += 1
         
-        return positions[:config.num_obstacles]
+        return positions[:count]
     
-    def _is_position_valid(self, x: float, y: float, existing_positions: List[Tuple[float, float]], 
-                          config: EnvironmentConfig) -> bool:
-        """위치가 유효한지 확인"""
-        
-        # 로봇 베이스와의 거리 확인
-        robot_distance = math.sqrt((x - self.robot_base_pos[0])**2 + 
-                                 (y - self.robot_base_pos[1])**2)
-        if robot_distance < 1.5:  # 로봇 주변 1.5m는 비워둠
-            return False
+    def _fill_from_sampler(self, sample, positions: np.ndarray, count: int, min_distance: float,
+                           max_attempts: int, limit: Optional[int] = None) -> int:
+        """
+        sample(n)이 반환하는 (n, 2) 후보 배치로 최대 max_attempts개까지 시도해 positions[count:]를 채우고 새 count 반환
+        (limit: 목표 개수, 기본값 len(positions). sample은 n개보다 적게 반환해도 됨)
         
-        # 다른 장애물과의 거리 확인
-        min_distance = config.min_distance_factor * (config.obstacle_size_range[0] + config.obstacle_size_range[1]) / 2
+        Numba가 있으면 후보 검사 전체를 JIT 커널로 처리하고, 없으면 로봇 베이스/기존 장애물과의
+        거리 조건은 배치 전체에 벡터화해서 먼저 거르고 남은 후보는 격자로 후보 순서대로 greedy하게 확인
+        (두 경로 모두 같은 후보 순서/조건이므로 결과 동일)
+        """
+        limit = len(positions) if limit is None else min(limit, len(positions))
+        min_d2 = min_distance**2
         
-        for ex, ey in existing_positions:
-            distance = math.sqrt((x - ex)**2 + (y - ey)**2)
-            if distance < min_distance:
-                return False
+        if NUMBA_AVAILABLE:
+            base_x, base_y = self.robot_base_pos
+            
+            attempts = 0
+            while attempts < max_attempts and count < limit:
+                n = min(self._CANDIDATE_BATCH, max_attempts - attempts, max(32, 4 * (limit - count)))
+                attempts += n
+                count = _accept_candidates_nb(sample(n), positions, count, limit,
+                                              float(base_x), float(base_y), self._robot_clear_sq, min_d2)
+            return count
+        
+        base = np.asarray(self.robot_base_pos, dtype=np.float64)
+        
+        attempts = 0
+        while attempts < max_attempts and count < limit:
+            # 남은 개수에 비례한 배치 크기 (작은 환경에서 불필요한 후보 생성 방지)
+            n = min(self._CANDIDATE_BATCH, max_attempts - attempts, max(32, 4 * (limit - count)))
+            attempts += n
+            
+            candidates = sample(n)
+            # 로봇 주변 1.5m는 비워둠
+            candidates = candidates[((candidates - base)**2).sum(axis=1) >= self._robot_clear_sq]
+            
+            # 이미 채택된 위치와의 최소 거리
+            if count and len(candidates):
+                d2 = ((candidates[:, None, :] - positions[None, :count, :])**2).sum(axis=2)
+                candidates = candidates[(d2 >= min_d2).all(axis=1)]
+            
+            # 이번 배치에서 채택된 후보끼리의 최소 거리 (배치마다 새 격자)
+            grid = _PositionGrid(min_distance)
+            for x, y in candidates.tolist():
+                if grid.is_clear(x, y):
+                    positions[count] = (x, y)
+                    count += 1
+                    grid.add(x, y)
+                    if count >= limit:
+                        break
         
-        return True
-    
-    def _distance(self, p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
-        """두 점 사이의 거리"""
-        return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
+        return count
     
     def _create_circle_obstacle(self, W: world, position: Tuple[float, float], radius: float):
         """원형 장애물 생성"""
@@ -432,24 +618,20 @@ class CircleEnvironmentGenerator:
         
         return body
     
-    def _generate_metadata(self, config: EnvironmentConfig, obstacles: List) -> Dict:
-        """환경 메타데이터 생성"""
-        
-        obstacle_info = []
-        for i, obstacle in enumerate(obstacles):
-            fixture = obstacle.fixtures[0] if obstacle.fixtures else None
-            info = {
-                'id': i,
-                'position': [obstacle.position.x, obstacle.position.y],
-                'radius': fixture.shape.radius if fixture else 0.0,
-                'type': 'circle'
-            }
-            obstacle_info.append(info)
+    def _generate_metadata(self, config: EnvironmentConfig, geometry: np.ndarray) -> Dict:
+        """환경 메타데이터 생성 (geometry: (N, 3) [x, y, radius] 배열)"""
+        
+        # Box2D 바디를 다시 읽지 않고 배열에서 tolist()로 파이썬 float 변환
+        # JSON 메타데이터 형식 유지 (장애물별 dict)
+        obstacle_info = [
+            {'id': i, 'position': [x, y], 'radius': radius, 'type': 'circle'}
+            for i, (x, y, radius) in enumerate(geometry.tolist())
+        ]
         
         return {
             'environment_type': 'circle_only',
-            'config': dataclasses.asdict(config),
-            'num_obstacles': len(obstacles),
+            'config': {name: getattr(config, name) for name in _CONFIG_FIELDS},
+            'num_obstacles': len(geometry),
             'obstacles': obstacle_info,
             'workspace_bounds': self.workspace_bounds,
             'robot_base_position': self.robot_base_pos,
@@ -459,7 +641,8 @@ class CircleEnvironmentGenerator:
 
 def create_circle_environment(difficulty: str = 'medium', 
                             config: Optional[EnvironmentConfig] = None,
-                            seed: Optional[int] = None) -> Tuple[world, List, Dict]:
+                            seed: Optional[int] = None,
+                            build_world: bool = True) -> Tuple[Optional[world], List, Dict]:
     """
     원형 장애물 환경 생성 헬퍼 함수
     
@@ -467,9 +650,11 @@ def create_circle_environment(difficulty: str = 'medium',
         difficulty: 'tutorial', 'easy', 'medium', 'hard', 'expert', 'random'
         config: 직접 설정 제공 (difficulty 무시)
         seed: 랜덤 시드
+        build_world: False면 Box2D 월드 생성 생략
     
     Returns:
         (Box2D world, obstacle_list, metadata)
+        build_world=False면 (None, (N, 3) [x, y, radius] 배열, metadata)
     """
     generator = CircleEnvironmentGenerator(seed=seed)
     
@@ -479,7 +664,41 @@ def create_circle_environment(difficulty: str = 'medium',
         else:
             config = generator.generate_predefined_difficulty_config(difficulty)
     
-    return generator.generate_environment_from_config(config)
+    return generator.generate_environment_from_config(config, build_world=build_world)
+
+
+def _generate_geometry(difficulty: str, seed: Optional[int]) -> Tuple[np.ndarray, Dict]:
+    """워커용: Box2D 월드 없이 (geometry, metadata)만 생성 (월드 객체는 pickle 불가)"""
+    _, geometry, metadata = create_circle_environment(difficulty=difficulty, seed=seed, build_world=False)
+    return geometry, metadata
+
+
+def generate_batch(n_envs: int, seeds: Optional[List[int]] = None, n_jobs: int = -1,
+                   difficulty: str = 'random') -> List[Tuple[np.ndarray, Dict]]:
+    """
+    여러 환경의 지오메트리를 병렬 생성
+    
+    Args:
+        n_envs: 생성할 환경 수
+        seeds: 환경별 시드 (None이면 0 ~ n_envs-1, 최소 n_envs개 필요)
+        n_jobs: joblib 워커 수 (-1: 모든 코어, joblib이 없으면 순차 실행)
+        difficulty: create_circle_environment의 difficulty
+    
+    Returns:
+        [(geometry, metadata), ...] - geometry는 (N, 3) [x, y, radius] 배열
+    """
+    if seeds is None:
+        seeds = range(n_envs)
+    seeds = list(seeds)
+    if len(seeds) < n_envs:
+        raise ValueError(f"Expected at least {n_envs} seeds, got {len(seeds)}")
+    seeds = seeds[:n_envs]
+    
+    # 각 환경은 시드로 만든 인스턴스 전용 난수 상태만 쓰므로 워커 간 독립적
+    if JOBLIB_AVAILABLE and n_jobs != 1:
+        return Parallel(n_jobs=n_jobs)(delayed(_generate_geometry)(difficulty, seed) for seed in seeds)
+    
+    return [_generate_geometry(difficulty, seed) for seed in seeds]
 
 
 if __name__ == "__main__":
@@ -24,6 +24,7 @@ from .concave_box2d_integration import (
 from .concave_environment_generator import (
     ConcaveEnvironmentGenerator,
     ConcaveEnvironmentConfig,
+    ObstacleBatch,
     create_concave_environment
 )
 
@@ -37,5 +38,6 @@ __all__ = [
     'generate_concave_shape_library',
     'ConcaveEnvironmentGenerator',
     'ConcaveEnvironmentConfig',
+    'ObstacleBatch',
     'create_concave_environment'
 ] 
\ No newline at end of file
@@ -13,9 +13,19 @@ import numpy as np
 import math
 import json
 import os
+import sys
+import mmap
+import random
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Dict, Optional, Union
-from Box2D.b2 import world, staticBody, polygonShape
-from dataclasses import dataclass, asdict
+from Box2D import b2_epsilon
+from Box2D.b2 import world, staticBody, polygonShape, fixtureDef, body as b2Body
+from dataclasses import dataclass, asdict, field
+
+log = logging.getLogger(__name__)
 
 try:
     from .concave_shape_generator import ConcaveShapeGenerator, ConcaveShapeType, create_concave_shape
@@ -23,22 +33,276 @@ except ImportError:
     from concave_shape_generator import ConcaveShapeGenerator, ConcaveShapeType, create_concave_shape
 
 try:
-    from shapely.geometry import Polygon
-    from shapely.ops import triangulate
-    SHAPELY_AVAILABLE = True
+    from scipy.spatial import Delaunay
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    SHAPELY_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+
+def _earclip_indices(xy):
+    """
+    Ear clipping 삼각분할 -> ((M, 3) 정점 인덱스 배열, 성공 여부)
+    
+    prev/next 인덱스 배열로 만든 원형 연결 리스트에서 귀(ear)를 하나씩 잘라냄.
+    더 이상 귀를 찾지 못했을 때 남은 부분이 면적 0(일직선 정점들)이면 버리고 성공,
+    아니면 (자기 교차 등) 실패
+    """
+    n = xy.shape[0]
+    triangles = np.empty((max(n - 2, 0), 3), dtype=np.int64)
+    if n < 3:
+        return triangles, False
+    
+    # 감김 방향 (shoelace 부호) - 시계 방향이면 외적 부호를 뒤집어서 판정
+    area = 0.0
+    for i in range(n):
+        j = (i + 1) % n
+        area += xy[i, 0] * xy[j, 1] - xy[j, 0] * xy[i, 1]
+    sign = 1.0 if area > 0 else -1.0
+    
+    prev = np.empty(n, dtype=np.int64)
+    nxt = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        prev[i] = (i + n - 1) % n
+        nxt[i] = (i + 1) % n
+    
+    count = 0
+    remaining = n
+    i = 0
+    stall = 0
+    while remaining > 3 and stall < remaining:
+        a = prev[i]
+        c = nxt[i]
+        ax, ay = xy[a, 0], xy[a, 1]
+        bx, by = xy[i, 0], xy[i, 1]
+        cx, cy = xy[c, 0], xy[c, 1]
+        
+        # 볼록한 꼭짓점이어야 귀 후보
+        is_ear = ((bx - ax) * (cy - ay) - (by - ay) * (cx - ax)) * sign > 1e-12
+        
+        # 나머지 오목한(reflex) 정점이 삼각형 (a, i, c) 안(경계 포함)에 있으면 귀가 아님
+        # (볼록한 정점만 경계에 걸리는 경우는 막지 않음 - 일직선 정점이 있는 형태에서 멈추지 않도록)
+        if is_ear:
+            j = nxt[c]
+            while j != a:
+                px, py = xy[j, 0], xy[j, 1]
+                qx, qy = xy[prev[j], 0], xy[prev[j], 1]
+                rx, ry = xy[nxt[j], 0], xy[nxt[j], 1]
+                if (((px - qx) * (ry - qy) - (py - qy) * (rx - qx)) * sign <= 0.0 and
+                        ((bx - ax) * (py - ay) - (by - ay) * (px - ax)) * sign >= 0.0 and
+                        ((cx - bx) * (py - by) - (cy - by) * (px - bx)) * sign >= 0.0 and
+                        ((ax - cx) * (py - cy) - (ay - cy) * (px - cx)) * sign >= 0.0):
+                    is_ear = False
+                    break
+                j = nxt[j]
+        
+        if is_ear:
+            triangles[count, 0] = a
+            triangles[count, 1] = i
+            triangles[count, 2] = c
+            count += 1
+            nxt[a] = c
+            prev[c] = a
+            remaining -= 1
+            i = c
+            stall = 0
+        else:
+            i = c
+            stall += 1
+    
+    if remaining == 3:
+        triangles[count, 0] = prev[i]
+        triangles[count, 1] = i
+        triangles[count, 2] = nxt[i]
+        count += 1
+        return triangles[:count], True
+    
+    # 귀를 더 못 찾은 경우: 남은 고리의 면적이 원래 면적에 비해 무시할 만하면 성공
+    rest = 0.0
+    j = i
+    for _ in range(remaining):
+        k = nxt[j]
+        rest += xy[j, 0] * xy[k, 1] - xy[k, 0] * xy[j, 1]
+        j = k
+    
+    return triangles[:count], abs(rest) <= 1e-9 * abs(area)
+
+
+def _convex_mask(xy):
+    """
+    연속한 세 정점의 외적 부호가 모두 같은지 (거의 0인 외적은 무시) - convex 판정 커널
+    
+    부호를 비트(양수 1, 음수 2)로 누적해서 두 부호가 모두 나오면 (acc == 3) 바로 종료
+    """
+    n = xy.shape[0]
+    acc = 0
+    for i in range(n):
+        a = (i + 1) % n
+        b = (i + 2) % n
+        cp = ((xy[a, 0] - xy[i, 0]) * (xy[b, 1] - xy[i, 1]) -
+              (xy[a, 1] - xy[i, 1]) * (xy[b, 0] - xy[i, 0]))
+        acc |= (cp > 1e-10) | ((cp < -1e-10) << 1)
+        if acc == 3:
+            return False
+    return True
+
+
+if NUMBA_AVAILABLE:
+    _earclip_indices = njit(_earclip_indices)
+    _convex_mask = njit(_convex_mask)
+
+
+def _pack_parts(parts) -> Tuple[np.ndarray, np.ndarray]:
+    """정점 수가 다른 다각형 리스트 -> (이어붙인 (K, 2) float32 정점, (M+1,) int32 시작 오프셋) (CSR 형태)"""
+    lengths = [len(part) for part in parts]
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int32)
+    np.cumsum(lengths, out=offsets[1:])
+    
+    xy = np.empty((offsets[-1], 2), dtype=np.float32)
+    for part, start, end in zip(parts, offsets[:-1], offsets[1:]):
+        xy[start:end] = part
+    
+    return xy, offsets
+
+
+def _unpack_parts(xy: np.ndarray, offsets: np.ndarray) -> List[np.ndarray]:
+    """_pack_parts의 역변환 - 각 다각형은 xy의 뷰"""
+    return [xy[start:end] for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+
+
+def _ensure_ccw(vertices) -> Tuple[np.ndarray, float]:
+    """
+    Shoelace 공식으로 부호 있는 면적을 구해 반시계 방향으로 정렬
+    
+    Returns:
+        (반시계 방향 (N, 2) float64 정점, 면적 (>= 0))
+    """
+    v = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    x, y = v[:, 0], v[:, 1]
+    area = 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+    
+    if area < 0:
+        return v[::-1].copy(), -area
+    return v, area
+
+
+def _drop_collinear(xy: np.ndarray, offsets: np.ndarray, tol: float = 1e-5) -> List[np.ndarray]:
+    """
+    CSR (정점, 오프셋)로 묶인 다각형들에서 앞뒤 변과 거의 일직선인 정점 제거 (|sin(꺾인 각)| <= tol)
+    -> 정점을 걸러낸 다각형 리스트 (모든 다각형을 한 번에 계산)
+    
+    Box2D의 convex hull 계산은 거의 일직선인 정점이 있으면 정점 순서에 따라
+    다각형 전체를 거부할 수 있음 ("count >= 3")
+    """
+    v = np.asarray(xy, dtype=np.float64)
+    lengths = np.diff(offsets)
+    part_id = np.repeat(np.arange(len(lengths)), lengths)
+    start = offsets[part_id]
+    length = lengths[part_id]
+    local = np.arange(len(v)) - start
+    
+    # 각 다각형 안에서 순환하는 이전/다음 정점
+    a = v - v[start + (local - 1) % length]
+    b = v[start + (local + 1) % length] - v
+    cross = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    keep = np.abs(cross) > tol * np.hypot(a[:, 0], a[:, 1]) * np.hypot(b[:, 0], b[:, 1])
+    
+    kept_offsets = np.zeros_like(offsets)
+    np.cumsum(np.bincount(part_id[keep], minlength=len(lengths)), out=kept_offsets[1:])
+    return _unpack_parts(v[keep], kept_offsets)
+
+
+def _as_vertex_list(points):
+    """ndarray 정점은 Box2D/JSON 경계에서만 파이썬 리스트로 변환 (리스트는 그대로)"""
+    return points.tolist() if isinstance(points, np.ndarray) else points
+
+
+# 구버전 pybox2d에는 CreateFixturesFromShapes가 없을 수 있음
+_BATCH_FIXTURES = hasattr(b2Body, 'CreateFixturesFromShapes')
+
+
+def _polygon_shapes(parts) -> List[polygonShape]:
+    """다각형 부분들 -> polygonShape 리스트 (Box2D는 fixture 생성 시 shape를 복사하므로 재사용 가능)"""
+    shapes = []
+    for part in parts:
+        shape = polygonShape()
+        shape.vertices = _as_vertex_list(part)
+        shapes.append(shape)
+    return shapes
+
+
+def _attach_shapes(body, shapes, fixture_def) -> list:
+    """공유 fixtureDef로 shape들을 한 번에 fixture로 추가 -> 생성된 fixture 리스트"""
+    if _BATCH_FIXTURES:
+        return body.CreateFixturesFromShapes(shapes=list(shapes), shapeFixture=fixture_def)
+    
+    fixtures = []
+    for shape in shapes:
+        fixture_def.shape = shape
+        fixtures.append(body.CreateFixture(fixture_def))
+    return fixtures
+
+
+def _create_polygon_fixtures(body, parts, fixture_def):
+    """
+    다각형 부분들을 polygonShape로 먼저 만들고 공유 fixtureDef로 한 번에 fixture 생성
+    (fixture마다 CreatePolygonFixture kwargs 파싱을 하지 않도록)
+    """
+    _attach_shapes(body, _polygon_shapes(parts), fixture_def)
+
 
+# Python 3.10+에서는 __slots__ 사용 (인스턴스 __dict__ 제거, 3.8/3.9는 일반 dataclass)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ConcaveObstacleData:
-    """Concave 장애물 데이터"""
+    """
+    Concave 장애물 데이터
+    
+    정점은 연속된 float32 배열로 보관 (리스트 입력은 __post_init__에서 변환).
+    convex_parts/triangles는 이어붙인 정점 배열(*_xy) + 오프셋(*_off)의 뷰 리스트.
+    box2d_parts는 8개 초과 정점 부분을 미리 삼각분할해 둔 Box2D용 분해 결과
+    (ConcaveBox2DAdapter가 라이브러리 등록 시 채움, 그 전에는 convex_parts와 동일).
+    정점은 항상 반시계 방향으로 정렬하고 면적(area)을 함께 보관
+    """
     name: str
     shape_type: str
-    vertices: List[Tuple[float, float]]  # 원본 concave 정점들
-    convex_parts: List[List[Tuple[float, float]]]  # convex 분해 결과
-    triangles: List[List[Tuple[float, float]]]  # 삼각분할 결과  
+    vertices: np.ndarray  # 원본 concave 정점들 (N, 2)
+    convex_parts: List[np.ndarray]  # convex 분해 결과
+    triangles: List[np.ndarray]  # 삼각분할 결과
     metadata: Dict
+    convex_xy: np.ndarray = field(init=False, repr=False)
+    convex_off: np.ndarray = field(init=False, repr=False)
+    tri_xy: np.ndarray = field(init=False, repr=False)
+    tri_off: np.ndarray = field(init=False, repr=False)
+    is_convex: bool = field(init=False, default=False)
+    vertex_count: int = field(init=False, default=0)
+    area: float = field(init=False, default=0.0)
+    box2d_parts: List[np.ndarray] = field(init=False, repr=False)
+    box2d_xy: np.ndarray = field(init=False, repr=False)
+    box2d_off: np.ndarray = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        vertices, self.area = _ensure_ccw(self.vertices)
+        self.vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        self.vertex_count = len(self.vertices)
+        self.convex_xy, self.convex_off = _pack_parts(self.convex_parts)
+        self.convex_parts = _unpack_parts(self.convex_xy, self.convex_off)
+        self.tri_xy, self.tri_off = _pack_parts(self.triangles)
+        self.triangles = _unpack_parts(self.tri_xy, self.tri_off)
+        self.box2d_xy, self.box2d_off, self.box2d_parts = self.convex_xy, self.convex_off, self.convex_parts
     
 
 class ConcaveBox2DAdapter:
@@ -47,51 +311,99 @@ class ConcaveBox2DAdapter:
     def __init__(self):
         self.shape_library = {}  # 미리 계산된 형태들 저장
         
-    def triangulate_polygon(self, vertices: List[Tuple[float, float]]) -> List[List[Tuple[float, float]]]:
-        """다각형을 삼각형들로 분할"""
+        # 모든 장애물 fixture가 공유하는 설정 (shape만 바꿔가며 재사용)
+        self._fixture_def = fixtureDef(density=1.0, friction=0.5)
+        
+        # 정점 바이트열 -> 삼각분할 결과 캐시 (같은 다각형을 반복 분할하지 않도록)
+        self._triangulate_cached = functools.lru_cache(maxsize=256)(self._triangulate_key)
+        
+        # (형태 이름, 스케일, 방법) -> body 로컬 좌표 polygonShape들 (같은 형태 반복 스폰 시 재사용)
+        self._library_shapes_cached = functools.lru_cache(maxsize=1024)(self._library_shapes)
+        
+        # (형태 이름, 스케일, 회전, 방법) -> 스케일/회전된 (정점, 오프셋) (양자화된 스케일/회전으로 스폰할 때 재사용)
+        self._library_local_parts_cached = functools.lru_cache(maxsize=1024)(self._library_local_parts)
+        
+    def triangulate_polygon(self, vertices: List[Tuple[float, float]]) -> Union[List[List[Tuple[float, float]]], np.ndarray]:
+        """다각형을 삼각형들로 분할 (ear clipping/fan은 (M, 3, 2) 배열 반환, 결과는 공유되므로 수정 금지)"""
         
         if len(vertices) < 3:
             return []
         
-        if SHAPELY_AVAILABLE:
+        return self._triangulate_cached(np.ascontiguousarray(vertices, dtype=np.float64).tobytes())
+    
+    def _triangulate_key(self, key: bytes) -> Union[List[List[Tuple[float, float]]], np.ndarray]:
+        """triangulate_polygon 캐시 본체 (key: float64 정점 배열의 바이트열)"""
+        vertices = np.frombuffer(key, dtype=np.float64).reshape(-1, 2)
+        
+        if SCIPY_AVAILABLE:
             try:
-                # Shapely를 사용한 삼각분할
-                poly = Polygon(vertices)
-                if not poly.is_valid:
-                    # 자기 교차 등의 문제 해결 시도
-                    poly = poly.buffer(0)
-                
-                triangles = []
-                # Delaunay 삼각분할 시도
-                from shapely.ops import triangulate as shapely_triangulate
-                triangulation = shapely_triangulate([poly])
-                
-                for tri in triangulation:
-                    if tri.intersects(poly):
-                        tri_coords = list(tri.exterior.coords[:-1])  # 마지막 점 제거
-                        if len(tri_coords) == 3:
-                            triangles.append(tri_coords)
-                
-                if triangles:
+                # Delaunay 삼각분할 (가는 삼각형이 적음)
+                triangles = self._delaunay_triangulation(vertices)
+                if triangles is not None:
                     return triangles
                     
             except Exception as e:
-                print(f"Shapely triangulation failed: {e}, using fallback method")
+                log.warning(f"Delaunay triangulation failed: {e}, using fallback method")
+        
+        # Ear clipping (concave 다각형도 올바르게 분할)
+        triangles = self._earclip(vertices)
+        if triangles is not None:
+            return triangles
         
         # 간단한 fan triangulation 사용 (fallback)
         return self._fan_triangulation(vertices)
     
-    def _fan_triangulation(self, vertices: List[Tuple[float, float]]) -> List[List[Tuple[float, float]]]:
-        """Fan triangulation (단순하지만 모든 다각형에 작동하지 않음)"""
+    def _delaunay_triangulation(self, vertices: np.ndarray) -> Optional[np.ndarray]:
+        """
+        정점들의 Delaunay 삼각분할 중 무게중심이 다각형 안에 있는 삼각형만 남김 -> (M, 3, 2) 배열
+        
+        Delaunay는 다각형 변을 강제하지 않으므로, 남은 삼각형 면적 합이 다각형 면적과
+        다르면 (변을 가로지르는 삼각형이 있으면) None
+        """
+        v = np.asarray(vertices, dtype=np.float64)
+        triangles = v[Delaunay(v).simplices]
+        
+        # 무게중심 (M, 2) x 다각형 변 (N,)에 대한 ray casting을 한 번에
+        px, py = triangles.mean(axis=1).T[:, :, None]
+        xi, yi = v[:, 0], v[:, 1]
+        xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+        straddle = (yi > py) != (yj > py)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crossing = straddle & (px < (xj - xi) * (py - yi) / (yj - yi) + xi)
+        triangles = triangles[crossing.sum(axis=1) % 2 == 1]
+        
+        a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+        tri_area = np.abs((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])).sum()
+        poly_area = abs(np.dot(xi, np.roll(yi, -1)) - np.dot(yi, np.roll(xi, -1)))
+        if abs(tri_area - poly_area) > 1e-6 * poly_area:
+            return None
+        
+        return triangles
+    
+    def _earclip(self, vertices: List[Tuple[float, float]]) -> Optional[np.ndarray]:
+        """Ear clipping 삼각분할 -> (n-2, 3, 2) 배열, 실패하면 None"""
+        v = np.ascontiguousarray(vertices, dtype=np.float64).reshape(-1, 2)
+        if len(v) < 3:
+            return None
+        
+        indices, ok = _earclip_indices(v)
+        if not ok:
+            return None  # 단순 다각형이 아님
+        
+        return v[indices]
+    
+    def _fan_triangulation(self, vertices: List[Tuple[float, float]]) -> np.ndarray:
+        """Fan triangulation (단순하지만 모든 다각형에 작동하지 않음) -> (n-2, 3, 2) 배열"""
         if len(vertices) < 3:
-            return []
+            return np.empty((0, 3, 2))
         
-        triangles = []
+        v = np.asarray(vertices, dtype=np.float64)
         
         # 첫 번째 정점을 중심으로 fan 형태로 삼각분할
-        for i in range(1, len(vertices) - 1):
-            triangle = [vertices[0], vertices[i], vertices[i + 1]]
-            triangles.append(triangle)
+        triangles = np.empty((len(v) - 2, 3, 2))
+        triangles[:, 0] = v[0]
+        triangles[:, 1] = v[1:-1]
+        triangles[:, 2] = v[2:]
         
         return triangles
     
@@ -104,67 +416,100 @@ class ConcaveBox2DAdapter:
         if self._is_convex(vertices):
             return [vertices]  # 이미 convex면 그대로 반환
         
-        if SHAPELY_AVAILABLE:
-            try:
-                # Shapely를 사용한 방법
-                return self._shapely_convex_decomposition(vertices)
-            except Exception as e:
-                print(f"Shapely convex decomposition failed: {e}, using simple method")
-        
-        # 간단한 방법: 삼각분할 후 인접한 삼각형들을 병합
+        # 삼각분할 후 인접한 삼각형들을 병합
         triangles = self.triangulate_polygon(vertices)
         return self._merge_triangles_to_convex(triangles)
     
-    def _shapely_convex_decomposition(self, vertices: List[Tuple[float, float]]) -> List[List[Tuple[float, float]]]:
-        """Shapely를 사용한 convex 분해"""
-        poly = Polygon(vertices)
-        if not poly.is_valid:
-            poly = poly.buffer(0)
+    def _merge_triangles_to_convex(self, triangles: List[List[Tuple[float, float]]]) -> List[np.ndarray]:
+        """
+        삼각형들을 convex 영역으로 병합 (Hertel-Mehlhorn)
         
-        # 단순화: 삼각분할 후 작은 convex 영역들로 병합
-        triangles = self.triangulate_polygon(vertices)
-        return self._merge_triangles_to_convex(triangles)
-    
-    def _merge_triangles_to_convex(self, triangles: List[List[Tuple[float, float]]]) -> List[List[Tuple[float, float]]]:
-        """삼각형들을 convex 영역으로 병합"""
-        if not triangles:
+        인접한 두 다각형이 공유하는 대각선을 지워도 합친 다각형이 convex이고
+        정점이 Box2D 제한(8개) 이하면 합침. 더 이상 합칠 수 없을 때까지 반복
+        """
+        if len(triangles) == 0:
             return []
         
-        # 간단한 구현: 각 삼각형을 개별 convex로 처리
-        # 더 정교한 구현에서는 인접한 삼각형들을 실제로 병합할 수 있음
-        convex_parts = []
-        
+        # 좌표가 같은 정점은 같은 id (삼각형들은 원본 정점 배열에서 잘라낸 것)
+        vertex_ids = {}
+        points = []
+        polygons = []
         for triangle in triangles:
-            if len(triangle) >= 3:
-                convex_parts.append(triangle)
+            if len(triangle) < 3:
+                continue
+            ring = []
+            for x, y in np.asarray(triangle, dtype=np.float64).tolist():
+                vid = vertex_ids.setdefault((x, y), len(points))
+                if vid == len(points):
+                    points.append((x, y))
+                ring.append(vid)
+            polygons.append(ring)
+        
+        points = np.array(points, dtype=np.float64)
+        
+        # 모든 다각형을 반시계 방향으로 - 공유 변은 한쪽에서 (u, v), 다른 쪽에서 (v, u)
+        for ring in polygons:
+            (ax, ay), (bx, by), (cx, cy) = points[ring[:3]]
+            if (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) < 0:
+                ring.reverse()
+        
+        # 방향 있는 변 (u, v) -> 그 변을 가진 다각형 인덱스
+        edge_owner = {}
+        for k, ring in enumerate(polygons):
+            for u, v in zip(ring, ring[1:] + ring[:1]):
+                edge_owner[(u, v)] = k
+        
+        alive = [True] * len(polygons)
+        merged = True
+        while merged:
+            merged = False
+            for (u, v), a in list(edge_owner.items()):
+                b = edge_owner.get((v, u))
+                if b is None or a == b or not (alive[a] and alive[b]) or edge_owner.get((u, v)) != a:
+                    continue
+                
+                ring_a, ring_b = polygons[a], polygons[b]
+                if len(ring_a) + len(ring_b) - 2 > 8:
+                    continue
+                
+                # a를 v에서 시작해 u로 끝나게, b는 u 다음부터 v 직전까지 이어 붙임
+                i = ring_a.index(v)
+                j = ring_b.index(u)
+                head = ring_a[i:] + ring_a[:i]
+                tail = (ring_b[j:] + ring_b[:j])[1:-1]
+                candidate = head + tail
+                
+                if not self._is_convex(points[candidate]):
+                    continue
+                
+                # 대각선 제거, b의 변들은 합친 다각형 소유로
+                del edge_owner[(u, v)], edge_owner[(v, u)]
+                for p, q in zip(ring_b, ring_b[1:] + ring_b[:1]):
+                    if (p, q) in edge_owner:
+                        edge_owner[(p, q)] = a
+                polygons[a] = candidate
+                alive[b] = False
+                merged = True
         
-        return convex_parts
+        return [points[ring] for ring, ok in zip(polygons, alive) if ok]
     
     def _is_convex(self, vertices: List[Tuple[float, float]]) -> bool:
         """다각형이 convex인지 확인"""
         if len(vertices) < 3:
             return False
         
-        def cross_product(o, a, b):
-            return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+        o = np.ascontiguousarray(vertices, dtype=np.float64)
         
-        n = len(vertices)
-        sign = None
+        if NUMBA_AVAILABLE:
+            return bool(_convex_mask(o))
         
-        for i in range(n):
-            o = vertices[i]
-            a = vertices[(i + 1) % n]
-            b = vertices[(i + 2) % n]
-            
-            cp = cross_product(o, a, b)
-            
-            if abs(cp) > 1e-10:  # 거의 0이 아닌 경우만
-                if sign is None:
-                    sign = cp > 0
-                elif (cp > 0) != sign:
-                    return False
+        # 연속한 세 정점 (o, a, b)의 외적을 한 번에 계산
+        a = np.roll(o, -1, axis=0)
+        b = np.roll(o, -2, axis=0)
+        cp = (a[:, 0] - o[:, 0]) * (b[:, 1] - o[:, 1]) - (a[:, 1] - o[:, 1]) * (b[:, 0] - o[:, 0])
         
-        return True
+        cp = cp[np.abs(cp) > 1e-10]  # 거의 0이 아닌 경우만
+        return bool((cp >= 0).all() or (cp <= 0).all())
     
     def create_box2d_body(self, world_obj: world, vertices: List[Tuple[float, float]], 
                          position: Tuple[float, float] = (0, 0), 
@@ -185,9 +530,15 @@ class ConcaveBox2DAdapter:
         if len(vertices) < 3:
             return None
         
+        # 감김 방향 정렬 - Box2D가 받지 못하는 면적 0에 가까운 형태는 body를 만들지 않음
+        vertices, area = _ensure_ccw(vertices)
+        if area <= b2_epsilon:
+            return None
+        
         try:
             # Body 생성
             body = world_obj.CreateStaticBody(position=position)
+            parts = []  # fixture로 만들 부분들 (모두 정점 3~8개)
             
             if method == 'triangles':
                 # 삼각분할 사용
@@ -195,7 +546,7 @@ class ConcaveBox2DAdapter:
                 for triangle in triangles:
                     if len(triangle) == 3:
                         # 삼각형을 body에 fixture로 추가
-                        body.CreatePolygonFixture(vertices=triangle, density=1.0, friction=0.5)
+                        parts.append(triangle)
                         
             elif method == 'convex':
                 # Convex 분해 사용
@@ -208,26 +559,29 @@ class ConcaveBox2DAdapter:
                             sub_triangles = self.triangulate_polygon(part)
                             for tri in sub_triangles:
                                 if len(tri) == 3:
-                                    body.CreatePolygonFixture(vertices=tri, density=1.0, friction=0.5)
+                                    parts.append(tri)
                         else:
-                            body.CreatePolygonFixture(vertices=part, density=1.0, friction=0.5)
+                            parts.append(part)
             
             else:  # auto
                 # 자동 선택: convex면 그대로, 아니면 적절한 방법 선택
-                if self._is_convex(vertices) and len(vertices) <= 8:
-                    body.CreatePolygonFixture(vertices=vertices, density=1.0, friction=0.5)
+                # (정점 수 확인을 먼저 해서 8개 초과면 convex 판정을 건너뜀)
+                if len(vertices) <= 8 and self._is_convex(vertices):
+                    parts.append(vertices)
                 else:
                     # 복잡하면 convex 분해 시도
                     convex_parts = self.convex_decomposition(vertices)
                     for part in convex_parts:
                         if len(part) >= 3 and len(part) <= 8:
-                            body.CreatePolygonFixture(vertices=part, density=1.0, friction=0.5)
+                            parts.append(part)
                         elif len(part) > 8:
                             # 너무 복잡하면 삼각분할
                             triangles = self.triangulate_polygon(part)
                             for tri in triangles:
                                 if len(tri) == 3:
-                                    body.CreatePolygonFixture(vertices=tri, density=1.0, friction=0.5)
+                                    parts.append(tri)
+            
+            _create_polygon_fixtures(body, parts, self._fixture_def)
             
             # Fixture가 하나도 없으면 body 삭제
             if not body.fixtures:
@@ -237,13 +591,16 @@ class ConcaveBox2DAdapter:
             return body
             
         except Exception as e:
-            print(f"Failed to create Box2D body: {e}")
+            log.warning(f"Failed to create Box2D body: {e}")
             return None
     
     def process_and_store_shape(self, shape_name: str, vertices: List[Tuple[float, float]], 
                                metadata: Dict) -> ConcaveObstacleData:
         """형태를 처리하고 저장 가능한 데이터로 변환"""
         
+        # 감김 방향을 반시계로 통일 (분해/삼각분할 결과도 같은 방향 기준)
+        vertices, _ = _ensure_ccw(vertices)
+        
         # Convex 분해
         convex_parts = self.convex_decomposition(vertices)
         
@@ -261,39 +618,86 @@ class ConcaveBox2DAdapter:
         )
         
         # 라이브러리에 저장
+        self._prepare_box2d_parts(obstacle_data)
         self.shape_library[shape_name] = obstacle_data
+        self._library_shapes_cached.cache_clear()
+        self._library_local_parts_cached.cache_clear()
         
         return obstacle_data
     
+    def _prepare_box2d_parts(self, obstacle_data: ConcaveObstacleData):
+        """
+        스폰 경로에서 할 판정/분할을 라이브러리 등록 시점에 미리 수행:
+        is_convex 플래그, 일직선 정점 제거, 정점 8개 초과 부분은 삼각분할, 3개 미만 부분은 제외
+        """
+        obstacle_data.is_convex = self._is_convex(obstacle_data.vertices)
+        
+        parts = []
+        for part in _drop_collinear(obstacle_data.convex_xy, obstacle_data.convex_off):
+            if len(part) > 8:
+                # Box2D 정점 수 제한 (최대 8개) - 면적이 거의 0인 삼각형은 제외
+                triangles = self.triangulate_polygon(part)
+                parts.extend(tri for tri in _drop_collinear(*_pack_parts(triangles)) if len(tri) == 3)
+            elif len(part) >= 3:
+                parts.append(part)
+        
+        obstacle_data.box2d_xy, obstacle_data.box2d_off = _pack_parts(parts)
+        obstacle_data.box2d_parts = _unpack_parts(obstacle_data.box2d_xy, obstacle_data.box2d_off)
+    
     def save_shape_library(self, filename: str):
-        """형태 라이브러리를 JSON 파일로 저장"""
+        """형태 라이브러리를 파일로 저장 (.npz면 압축 바이너리, 그 외에는 JSON)"""
+        
+        if filename.endswith('.npz'):
+            self._save_npz_library(filename)
+            log.info(f"Shape library saved to {filename}")
+            return
         
+        # orjson은 numpy 배열을 직접 직렬화하므로 리스트 변환은 stdlib json일 때만
+        to_json = (lambda points: points) if ORJSON_AVAILABLE else _as_vertex_list
         library_data = {}
         
         for name, obstacle_data in self.shape_library.items():
             library_data[name] = {
                 'name': obstacle_data.name,
                 'shape_type': obstacle_data.shape_type,
-                'vertices': obstacle_data.vertices,
-                'convex_parts': obstacle_data.convex_parts,
-                'triangles': obstacle_data.triangles,
+                'vertices': to_json(obstacle_data.vertices),
+                'convex_parts': [to_json(part) for part in obstacle_data.convex_parts],
+                'triangles': [to_json(tri) for tri in obstacle_data.triangles],
                 'metadata': obstacle_data.metadata
             }
         
-        with open(filename, 'w') as f:
-            json.dump(library_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(library_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(library_data, f, indent=2)
         
-        print(f"Shape library saved to {filename}")
+        log.info(f"Shape library saved to {filename}")
     
     def load_shape_library(self, filename: str):
-        """JSON 파일에서 형태 라이브러리 로드"""
+        """파일에서 형태 라이브러리 로드 (.npz 또는 JSON)"""
         
         if not os.path.exists(filename):
-            print(f"Shape library file not found: {filename}")
+            log.warning(f"Shape library file not found: {filename}")
+            return
+        
+        self._library_shapes_cached.cache_clear()
+        self._library_local_parts_cached.cache_clear()
+        
+        if filename.endswith('.npz'):
+            self._load_npz_library(filename)
+            log.info(f"Loaded {len(self.shape_library)} shapes from {filename}")
             return
         
-        with open(filename, 'r') as f:
-            library_data = json.load(f)
+        if ORJSON_AVAILABLE and os.path.getsize(filename) > 0:
+            # 파일을 메모리 매핑해서 읽기 버퍼 복사 없이 바로 파싱
+            with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    library_data = orjson.loads(view)
+        else:
+            with open(filename, 'r') as f:
+                library_data = json.load(f)
         
         self.shape_library = {}
         
@@ -301,14 +705,59 @@ class ConcaveBox2DAdapter:
             obstacle_data = ConcaveObstacleData(
                 name=data['name'],
                 shape_type=data['shape_type'],
-                vertices=data['vertices'],
+                vertices=np.asarray(data['vertices'], dtype=np.float32),
                 convex_parts=data['convex_parts'],
                 triangles=data['triangles'],
                 metadata=data['metadata']
             )
+            self._prepare_box2d_parts(obstacle_data)
             self.shape_library[name] = obstacle_data
         
-        print(f"Loaded {len(self.shape_library)} shapes from {filename}")
+        log.info(f"Loaded {len(self.shape_library)} shapes from {filename}")
+    
+    def _save_npz_library(self, filename: str):
+        """
+        NPZ 저장: 형태마다 정점 float32 배열과 convex 분해/삼각분할의 CSR (정점, 오프셋) 배열,
+        이름/타입/메타데이터는 '__index__'에 JSON 문자열로 저장
+        """
+        arrays = {}
+        index = {}
+        
+        for name, obstacle_data in self.shape_library.items():
+            index[name] = {
+                'name': obstacle_data.name,
+                'shape_type': obstacle_data.shape_type,
+                'metadata': obstacle_data.metadata
+            }
+            arrays[f'{name}/vertices'] = obstacle_data.vertices
+            arrays[f'{name}/convex_xy'] = obstacle_data.convex_xy
+            arrays[f'{name}/convex_off'] = obstacle_data.convex_off
+            arrays[f'{name}/tri_xy'] = obstacle_data.tri_xy
+            arrays[f'{name}/tri_off'] = obstacle_data.tri_off
+        
+        arrays['__index__'] = np.array(json.dumps(index))
+        
+        np.savez_compressed(filename, **arrays)
+    
+    def _load_npz_library(self, filename: str):
+        """NPZ 라이브러리 로드 - 분해 결과는 CSR 배열의 뷰로 복원"""
+        
+        self.shape_library = {}
+        
+        with np.load(filename) as npz:
+            index = json.loads(str(npz['__index__']))
+            
+            for name, data in index.items():
+                obstacle_data = ConcaveObstacleData(
+                    name=data['name'],
+                    shape_type=data['shape_type'],
+                    vertices=npz[f'{name}/vertices'],
+                    convex_parts=_unpack_parts(npz[f'{name}/convex_xy'], npz[f'{name}/convex_off']),
+                    triangles=_unpack_parts(npz[f'{name}/tri_xy'], npz[f'{name}/tri_off']),
+                    metadata=data['metadata']
+                )
+                self._prepare_box2d_parts(obstacle_data)
+                self.shape_library[name] = obstacle_data
     
     def get_shape(self, shape_name: str) -> Optional[ConcaveObstacleData]:
         """이름으로 형태 데이터 가져오기"""
@@ -327,89 +776,263 @@ class ConcaveBox2DAdapter:
         
         obstacle_data = self.get_shape(shape_name)
         if obstacle_data is None:
-            print(f"Shape '{shape_name}' not found in library")
+            log.warning(f"Shape '{shape_name}' not found in library")
             return None
         
-        # 변형 적용 (스케일, 회전)
-        transformed_vertices = self._transform_vertices(
-            obstacle_data.vertices, position, scale, rotation
-        )
+        # 스케일 후 면적이 Box2D 허용치 이하면 생성 생략
+        if obstacle_data.area * scale * scale <= b2_epsilon:
+            return None
         
-        return self.create_box2d_body(world_obj, transformed_vertices, (0, 0), method)
+        try:
+            shapes = self._library_shapes_cached(shape_name, float(scale), method)
+        except Exception as e:
+            log.warning(f"Failed to create Box2D body: {e}")
+            return None
+        
+        if not shapes:
+            return None
+        
+        # 위치/회전은 body 변환으로 적용 - fixture는 스케일만 적용한 로컬 좌표
+        body = world_obj.CreateStaticBody(position=position, angle=rotation)
+        _attach_shapes(body, shapes, self._fixture_def)
+        
+        return body
     
-    def _transform_vertices(self, vertices: List[Tuple[float, float]], 
-                           position: Tuple[float, float], 
-                           scale: float, rotation: float) -> List[Tuple[float, float]]:
-        """정점들에 변형 적용"""
+    def attach_library_shape(self, body: staticBody, shape_name: str,
+                             position: Tuple[float, float] = (0, 0),
+                             scale: float = 1.0,
+                             rotation: float = 0.0,
+                             method: str = 'auto') -> Optional[list]:
+        """
+        라이브러리 형태를 새 body 대신 기존 body(원점, 회전 0)에 fixture로 추가
+        (여러 정적 장애물을 body 하나에 모을 때 사용)
+        
+        Returns:
+            추가된 fixture 리스트 또는 None
+        """
+        obstacle_data = self.get_shape(shape_name)
+        if obstacle_data is None:
+            log.warning(f"Shape '{shape_name}' not found in library")
+            return None
         
-        transformed = []
-        px, py = position
-        cos_r = math.cos(rotation)
-        sin_r = math.sin(rotation)
+        # 스케일 후 면적이 Box2D 허용치 이하면 생성 생략
+        if obstacle_data.area * scale * scale <= b2_epsilon:
+            return None
         
-        for x, y in vertices:
-            # 스케일 적용
-            x *= scale
-            y *= scale
-            
-            # 회전 적용
-            x_rot = x * cos_r - y * sin_r
-            y_rot = x * sin_r + y * cos_r
-            
-            # 위치 이동
-            x_final = x_rot + px
-            y_final = y_rot + py
+        # 스케일/회전된 정점은 캐시에서 재사용하고 위치 이동만 매번 (body가 원점이므로 월드 좌표)
+        xy, offsets = self._library_local_parts_cached(shape_name, float(scale), float(rotation), method)
+        if len(offsets) < 2:
+            return None
+        
+        transformed = xy + position
+        
+        try:
+            shapes = _polygon_shapes(_unpack_parts(transformed, offsets))
+        except Exception as e:
+            log.warning(f"Failed to create Box2D fixtures: {e}")
+            return None
+        
+        return _attach_shapes(body, shapes, self._fixture_def)
+    
+    def _library_parts(self, obstacle_data: ConcaveObstacleData, method: str) -> Tuple[np.ndarray, np.ndarray]:
+        """스폰에 쓸 (정점, 오프셋) - 라이브러리에 저장된 Box2D용 분해 결과를 그대로 재사용"""
+        if method == 'triangles':
+            return obstacle_data.tri_xy, obstacle_data.tri_off
+        return obstacle_data.box2d_xy, obstacle_data.box2d_off
+    
+    def _library_local_parts(self, shape_name: str, scale: float, rotation: float,
+                             method: str) -> Tuple[np.ndarray, np.ndarray]:
+        """스케일 -> 회전을 2x2 행렬 곱 한 번으로 적용한 float64 정점 (_library_local_parts_cached 본체, 수정 금지)"""
+        xy, offsets = self._library_parts(self.shape_library[shape_name], method)
+        
+        cos_r = math.cos(rotation) * scale
+        sin_r = math.sin(rotation) * scale
+        local = xy.astype(np.float64) @ np.array([[cos_r, sin_r], [-sin_r, cos_r]])
+        local.flags.writeable = False
+        
+        return local, offsets
+    
+    def _library_shapes(self, shape_name: str, scale: float, method: str) -> Tuple[polygonShape, ...]:
+        """라이브러리 형태의 Box2D용 분해 결과를 스케일해서 polygonShape로 (_library_shapes_cached 본체)"""
+        xy, offsets = self._library_parts(self.shape_library[shape_name], method)
+        
+        return tuple(_polygon_shapes(_unpack_parts(xy.astype(np.float64) * scale, offsets)))
+    
+    def create_bodies_from_library(self, world_obj: world, shape_name: str, poses: np.ndarray,
+                                   method: str = 'auto') -> List[Optional[staticBody]]:
+        """
+        같은 형태를 여러 자세로 한 번에 스폰
+        
+        Args:
+            poses: (B, 4) [x, y, scale, rotation] 배열
             
-            transformed.append((x_final, y_final))
+        Returns:
+            자세별 Box2D body 리스트 (생성 실패는 None)
+        """
+        obstacle_data = self.get_shape(shape_name)
+        if obstacle_data is None:
+            log.warning(f"Shape '{shape_name}' not found in library")
+            return []
+        
+        xy, offsets = self._library_parts(obstacle_data, method)
         
-        return transformed
+        poses = np.asarray(poses, dtype=np.float64).reshape(-1, 4)
+        
+        # 자세별 스케일을 모든 정점에 일괄 적용 -> (B, K, 2), 위치/회전은 body 변환으로
+        scaled = xy.astype(np.float64)[None] * poses[:, 2, None, None]
+        
+        # Box2D API는 body 단위이므로 생성은 자세마다 (스케일 후 면적이 너무 작은 자세는 생략)
+        large_enough = obstacle_data.area * poses[:, 2] ** 2 > b2_epsilon
+        return [self.create_box2d_body_from_parts(world_obj, _unpack_parts(points, offsets),
+                                                  (x, y), rotation) if ok else None
+                for points, (x, y, _, rotation), ok in zip(scaled, poses.tolist(), large_enough.tolist())]
+    
+    def create_box2d_body_from_parts(self, world_obj: world, parts: List[List[Tuple[float, float]]],
+                                     position: Tuple[float, float] = (0, 0),
+                                     angle: float = 0.0) -> Optional[staticBody]:
+        """
+        이미 분해된 convex 부분/삼각형들로 Box2D body 생성 (분해 과정 생략)
+        
+        parts는 모두 정점 3~8개여야 함 (ConcaveObstacleData.box2d_parts/triangles)
+        """
+        
+        body = world_obj.CreateStaticBody(position=position, angle=angle)
+        
+        try:
+            _create_polygon_fixtures(body, parts, self._fixture_def)
+        except Exception as e:
+            log.warning(f"Failed to create Box2D body: {e}")
+            world_obj.DestroyBody(body)
+            return None
+        
+        # Fixture가 하나도 없으면 body 삭제
+        if not body.fixtures:
+            world_obj.DestroyBody(body)
+            return None
+        
+        return body
+
+
+# 라이브러리 생성 워커 프로세스별 어댑터/생성기 (첫 작업에서 생성)
+_worker_adapter = None
+_worker_generator = None
+
+
+def _generate_library_shape(job):
+    """
+    라이브러리 형태 하나 생성 + 분해 (워커 프로세스에서 실행)
+    
+    Args:
+        job: (shape_type, index, seed) - 작업마다 시드를 고정해서 워커 수와 무관하게 같은 결과
+        
+    Returns:
+        (이름, 정점, convex 분해, 삼각분할, 메타데이터) 또는 정점이 부족하면 None
+    """
+    global _worker_adapter, _worker_generator
+    if _worker_adapter is None:
+        _worker_adapter = ConcaveBox2DAdapter()
+        _worker_generator = ConcaveShapeGenerator()
+    
+    shape_type, i, seed = job
+    random.seed(seed)
+    np.random.seed(seed)
+    
+    # 랜덤 설정 생성
+    config = _worker_generator.generate_random_config(shape_type)
+    
+    # 형태 생성
+    vertices = _worker_generator.generate_shape(config, (0, 0))
+    
+    if len(vertices) < 3:
+        return None
+    
+    # 메타데이터 준비
+    metadata = {
+        'shape_type': shape_type.value,
+        'complexity': config.complexity,
+        'size_range': config.size_range,
+        'detail_level': config.detail_level,
+        'rotation': config.rotation,
+        'scale_x': config.scale_x,
+        'scale_y': config.scale_y
+    }
+    
+    # 분해는 워커에서, 라이브러리 저장은 메인 프로세스에서
+    return (f"{shape_type.value}_{i:02d}", vertices,
+            _worker_adapter.convex_decomposition(vertices),
+            _worker_adapter.triangulate_polygon(vertices),
+            metadata)
 
 
 def generate_concave_shape_library(output_file: str = "concave_shapes.json", 
-                                 shapes_per_type: int = 5):
-    """다양한 concave 형태들의 라이브러리 생성"""
+                                 shapes_per_type: int = 5,
+                                 max_workers: Optional[int] = None):
+    """
+    다양한 concave 형태들의 라이브러리 생성
     
-    print(f"Generating concave shape library with {shapes_per_type} shapes per type...")
+    Args:
+        max_workers: 형태 생성/분해 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 순차 실행)
+    """
+    
+    log.info(f"Generating concave shape library with {shapes_per_type} shapes per type...")
     
     adapter = ConcaveBox2DAdapter()
-    generator = ConcaveShapeGenerator()
+    
+    # 각 형태 타입별로 여러 변형 - 작업별 시드는 현재 random 상태에서 뽑음
+    jobs = [(shape_type, i, random.getrandbits(32))
+            for shape_type in ConcaveShapeType for i in range(shapes_per_type)]
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    
+    # 순차 실행 시 작업마다 전역 난수 시드를 바꾸므로 호출 측의 난수 상태를 저장해 두었다가 복원
+    random_state = random.getstate()
+    np_random_state = np.random.get_state()
+    
+    if max_workers == 1:
+        results = map(_generate_library_shape, jobs)
+        executor = None
+    else:
+        # Linux에서는 fork로 워커를 띄워 import된 모듈을 그대로 상속
+        mp_context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+        executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+        results = executor.map(_generate_library_shape, jobs,
+                               chunksize=max(1, len(jobs) // (max_workers * 4)))
     
     shape_count = 0
     
-    # 각 형태 타입별로 여러 변형 생성
-    for shape_type in ConcaveShapeType:
-        for i in range(shapes_per_type):
-            # 랜덤 설정 생성
-            config = generator.generate_random_config(shape_type)
+    try:
+        for result in results:
+            if result is None:
+                continue
             
-            # 형태 생성
-            vertices = generator.generate_shape(config, (0, 0))
+            shape_name, vertices, convex_parts, triangles, metadata = result
             
-            if len(vertices) >= 3:
-                # 이름 생성
-                shape_name = f"{shape_type.value}_{i:02d}"
-                
-                # 메타데이터 준비
-                metadata = {
-                    'shape_type': shape_type.value,
-                    'complexity': config.complexity,
-                    'size_range': config.size_range,
-                    'detail_level': config.detail_level,
-                    'rotation': config.rotation,
-                    'scale_x': config.scale_x,
-                    'scale_y': config.scale_y
-                }
-                
-                # 처리 및 저장
-                adapter.process_and_store_shape(shape_name, vertices, metadata)
-                shape_count += 1
-                
-                print(f"Generated {shape_name}: {len(vertices)} vertices")
+            # 저장
+            obstacle_data = ConcaveObstacleData(
+                name=shape_name,
+                shape_type=metadata['shape_type'],
+                vertices=vertices,
+                convex_parts=convex_parts,
+                triangles=triangles,
+                metadata=metadata
+            )
+            adapter._prepare_box2d_parts(obstacle_data)
+            adapter.shape_library[shape_name] = obstacle_data
+            shape_count += 1
+            
+            if log.isEnabledFor(logging.INFO):
+                log.info(f"Generated {shape_name}: {len(vertices)} vertices")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        else:
+            random.setstate(random_state)
+            np.random.set_state(np_random_state)
     
     # 라이브러리 저장
     adapter.save_shape_library(output_file)
     
-    print(f"Shape library generation complete: {shape_count} shapes saved to {output_file}")
+    log.info(f"Shape library generation complete: {shape_count} shapes saved to {output_file}")
     
     return adapter
 
@@ -445,6 +1068,9 @@ def test_box2d_integration():
 
 
 if __name__ == "__main__":
+    # 라이브러리 생성/저장 로그도 출력
+    logging.basicConfig(level=logging.INFO)
+    
     # 테스트 실행
     print("Testing Concave Box2D Integration...")
     
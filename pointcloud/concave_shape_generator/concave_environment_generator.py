@@ -14,6 +14,7 @@ import numpy as np
 import math
 import random
 import os
+import logging
 from typing import List, Tuple, Dict, Optional, Union
 from Box2D.b2 import world, staticBody
 from dataclasses import dataclass
@@ -27,6 +28,92 @@ except ImportError:
     from concave_box2d_integration import ConcaveBox2DAdapter, generate_concave_shape_library
     from random_environment_generator import RandomEnvironmentGenerator
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+
+def _disk_fits(x, y, bounds, robot_x, robot_y, cell, min_distance_sq, grid, points):
+    """후보 점이 경계 안이고 로봇/격자 주변 5x5 셀의 점들과 충분히 떨어져 있는지"""
+    min_x, max_x, min_y, max_y = bounds
+    if not (min_x <= x <= max_x and min_y <= y <= max_y):
+        return False
+    if (x - robot_x) ** 2 + (y - robot_y) ** 2 < 4.0:
+        return False
+    
+    cx = int((x - min_x) / cell)
+    cy = int((y - min_y) / cell)
+    for nx in range(max(cx - 2, 0), min(cx + 3, grid.shape[0])):
+        for ny in range(max(cy - 2, 0), min(cy + 3, grid.shape[1])):
+            j = grid[nx, ny]
+            if j >= 0 and (x - points[j, 0]) ** 2 + (y - points[j, 1]) ** 2 < min_distance_sq:
+                return False
+    return True
+
+
+def _poisson_disk_fill(bounds, robot_x, robot_y, min_distance, outer,
+                       seeds, u_index, u_radius, u_angle, points):
+    """
+    Bridson Poisson disk로 points를 채우고 점 개수 반환 (numba로 컴파일되는 본체)
+    
+    난수는 호출 측에서 미리 뽑아 전달 (seeds: 시작 후보, u_*: 반복마다 쓰는 [0, 1) 난수)
+    """
+    min_x, max_x, min_y, max_y = bounds
+    min_distance_sq = min_distance * min_distance
+    cell = min_distance / math.sqrt(2)
+    grid = np.full((int((max_x - min_x) / cell) + 1, int((max_y - min_y) / cell) + 1), -1, dtype=np.int64)
+    active = np.empty(len(points), dtype=np.int64)
+    count = 0
+    num_active = 0
+    
+    # 시작점: 로봇과 떨어진 임의의 점
+    for s in range(len(seeds)):
+        x, y = seeds[s, 0], seeds[s, 1]
+        if _disk_fits(x, y, bounds, robot_x, robot_y, cell, min_distance_sq, grid, points):
+            grid[int((x - min_x) / cell), int((y - min_y) / cell)] = count
+            points[count, 0], points[count, 1] = x, y
+            active[0] = count
+            count += 1
+            num_active = 1
+            break
+    
+    it = 0
+    while num_active > 0 and it < len(u_index):
+        i = int(u_index[it] * num_active)
+        ax, ay = points[active[i], 0], points[active[i], 1]
+        
+        # 활성 점 주변 [r, outer*r] 고리 안에서 면적 균일하게 후보 생성
+        added = False
+        for c in range(u_radius.shape[1]):
+            radius = min_distance * math.sqrt(1.0 + (outer * outer - 1.0) * u_radius[it, c])
+            angle = 2 * math.pi * u_angle[it, c]
+            x = ax + radius * math.cos(angle)
+            y = ay + radius * math.sin(angle)
+            if _disk_fits(x, y, bounds, robot_x, robot_y, cell, min_distance_sq, grid, points):
+                grid[int((x - min_x) / cell), int((y - min_y) / cell)] = count
+                points[count, 0], points[count, 1] = x, y
+                active[num_active] = count
+                count += 1
+                num_active += 1
+                added = True
+                break
+        
+        if not added:
+            num_active -= 1
+            active[i] = active[num_active]
+        it += 1
+    
+    return count
+
+
+if NUMBA_AVAILABLE:
+    _disk_fits = njit(_disk_fits)
+    _poisson_disk_fill = njit(_poisson_disk_fill)
+
 
 @dataclass
 class ConcaveEnvironmentConfig:
@@ -39,7 +126,69 @@ class ConcaveEnvironmentConfig:
     allow_scaling: bool = True
     use_mixed_obstacles: bool = True  # 기존 장애물과 혼합 여부
     workspace_bounds: Tuple[float, float, float, float] = (0, 10, 0, 8)
+    merge_static_bodies: bool = False  # 정적 장애물을 body 하나의 fixture들로 합칠지 여부 (obstacle_list 항목이 fixture 리스트가 됨)
+    scale_step: float = 0.05  # 스케일 양자화 간격 (0이면 연속값, 변환된 정점 캐시 재사용용)
+    rotation_step: float = math.pi / 32  # 회전 양자화 간격 (0이면 연속값)
+    
+
+@dataclass
+class ObstacleBatch:
+    """
+    장애물 메타데이터 (장애물마다 dict 대신 필드별 배열, SoA)
     
+    기본 장애물은 shape_name '', scale 1, rotation 0으로 기록
+    """
+    positions: np.ndarray  # (N, 2) float32
+    scales: np.ndarray  # (N,) float32
+    rotations: np.ndarray  # (N,) float32
+    types: np.ndarray  # (N,) uint8, TYPE_NAMES 인덱스
+    shape_names: List[str]
+    num_fixtures: np.ndarray  # (N,) uint16
+    
+    TYPE_NAMES = ('concave', 'rectangle', 'circle')
+    
+    @classmethod
+    def allocate(cls, capacity: int) -> 'ObstacleBatch':
+        """최대 capacity개를 담을 빈 배열 할당"""
+        return cls(
+            positions=np.zeros((capacity, 2), dtype=np.float32),
+            scales=np.ones(capacity, dtype=np.float32),
+            rotations=np.zeros(capacity, dtype=np.float32),
+            types=np.zeros(capacity, dtype=np.uint8),
+            shape_names=[''] * capacity,
+            num_fixtures=np.zeros(capacity, dtype=np.uint16)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.types)
+    
+    def record(self, index: int, position: Tuple[float, float], obstacle_type: str,
+               shape_name: str = '', scale: float = 1.0, rotation: float = 0.0, num_fixtures: int = 0):
+        """index 위치에 장애물 하나 기록"""
+        self.positions[index] = position
+        self.scales[index] = scale
+        self.rotations[index] = rotation
+        self.types[index] = self.TYPE_NAMES.index(obstacle_type)
+        self.shape_names[index] = shape_name
+        self.num_fixtures[index] = num_fixtures
+    
+    def compress(self, mask: np.ndarray) -> 'ObstacleBatch':
+        """mask가 True인 항목만 남긴 배치"""
+        return ObstacleBatch(self.positions[mask], self.scales[mask], self.rotations[mask], self.types[mask],
+                             [name for name, keep in zip(self.shape_names, mask.tolist()) if keep],
+                             self.num_fixtures[mask])
+    
+    def to_dict(self) -> Dict[str, list]:
+        """JSON 저장용 dict-of-lists"""
+        return {
+            'positions': self.positions.tolist(),
+            'scales': self.scales.tolist(),
+            'rotations': self.rotations.tolist(),
+            'types': [self.TYPE_NAMES[t] for t in self.types.tolist()],
+            'shape_names': list(self.shape_names),
+            'num_fixtures': self.num_fixtures.tolist()
+        }
+
 
 class ConcaveEnvironmentGenerator:
     """Concave 장애물 환경 생성기"""
@@ -51,7 +200,7 @@ class ConcaveEnvironmentGenerator:
                  seed: Optional[int] = None):
         """
         Args:
-            concave_library_file: concave 형태 라이브러리 JSON 파일
+            concave_library_file: concave 형태 라이브러리 파일 (JSON 또는 .npz)
             workspace_bounds: 작업공간 경계
             robot_base_pos: 로봇 베이스 위치
             seed: 랜덤 시드
@@ -59,9 +208,7 @@ class ConcaveEnvironmentGenerator:
         self.workspace_bounds = workspace_bounds
         self.robot_base_pos = robot_base_pos
         
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
+        self.reseed(seed)
         
         # Concave 어댑터 초기화
         self.concave_adapter = ConcaveBox2DAdapter()
@@ -86,91 +233,119 @@ class ConcaveEnvironmentGenerator:
             max_y - 1.0
         )
     
+    def reseed(self, seed: Optional[int]):
+        """random/np.random 전역 시드와 위치 계획용 난수 생성기 재설정 (None이면 전역 시드는 유지)"""
+        if seed is not None:
+            random.seed(seed)
+            np.random.seed(seed)
+        
+        # 위치 계획용 난수 생성기 (후보 좌표를 배열 단위로 뽑음)
+        self._rng = np.random.default_rng(seed)
+    
     def _ensure_concave_library(self):
         """Concave 라이브러리 파일이 없으면 생성"""
         
         if not os.path.exists(self.concave_library_file):
-            print(f"Concave library not found, generating: {self.concave_library_file}")
+            log.info(f"Concave library not found, generating: {self.concave_library_file}")
             generate_concave_shape_library(self.concave_library_file, shapes_per_type=3)
         
         # 라이브러리 로드
         self.concave_adapter.load_shape_library(self.concave_library_file)
         
         if not self.concave_adapter.list_shapes():
-            print("Warning: No concave shapes available, generating basic library")
+            log.warning("No concave shapes available, generating basic library")
             generate_concave_shape_library(self.concave_library_file, shapes_per_type=2)
             self.concave_adapter.load_shape_library(self.concave_library_file)
+        
+        # 형태 이름 목록과 타입별 인덱스는 라이브러리 로드 시 한 번만 계산
+        self._all_shapes = tuple(self.concave_adapter.list_shapes())
+        self._shapes_by_type = {}
+        for name in self._all_shapes:
+            shape_type = '_'.join(name.split('_', 2)[:2])
+            self._shapes_by_type.setdefault(shape_type, []).append(name)
+        self._shape_types = tuple(sorted(self._shapes_by_type))
+    
+    def _shapes_matching(self, concave_types: List[str]) -> Tuple[str, ...]:
+        """주어진 타입들에 해당하는 형태 이름들 (없으면 전체 형태)"""
+        matching = tuple(name for shape_type in concave_types
+                         for name in self._shapes_by_type.get(shape_type, ()))
+        return matching or self._all_shapes
     
-    def generate_mixed_environment(self, config: ConcaveEnvironmentConfig) -> Tuple[world, List, Dict]:
+    def generate_mixed_environment(self, config: ConcaveEnvironmentConfig,
+                                   seed: Optional[int] = None) -> Tuple[world, List, Dict]:
         """
         Concave와 기존 장애물을 혼합한 환경 생성
         
         Args:
             config: 환경 설정
+            seed: 주어지면 생성 전에 재시드 (같은 생성기를 재사용해도 결과 재현)
             
         Returns:
             (Box2D world, obstacle_list, metadata)
+            config.merge_static_bodies면 obstacle_list의 각 항목은 공용 정적 body에 붙은 fixture 리스트
         """
         
-        print(f"Generating mixed environment:")
-        print(f"  - Total obstacles: {config.num_total_obstacles}")
-        print(f"  - Concave ratio: {config.concave_ratio}")
-        print(f"  - Concave types: {config.concave_types}")
+        if seed is not None:
+            self.reseed(seed)
+        
+        # 생성 경로의 debug 로그는 비활성일 때 문자열 포맷도 하지 않도록 % 인자로 전달
+        log.debug("Generating mixed environment: total=%d, concave_ratio=%s, concave_types=%s",
+                  config.num_total_obstacles, config.concave_ratio, config.concave_types)
         
         # World 생성
         W = world(gravity=(0, 0), doSleep=True)
-        obstacles = []
+        
+        # 정적 장애물은 원점의 body 하나에 fixture로 모아 body 수를 줄임
+        static_root = W.CreateStaticBody(position=(0, 0)) if config.merge_static_bodies else None
         
         # 장애물 개수 분배
         num_concave = int(config.num_total_obstacles * config.concave_ratio)
         num_basic = config.num_total_obstacles - num_concave
         
-        print(f"  - Concave obstacles: {num_concave}")
-        print(f"  - Basic obstacles: {num_basic}")
+        log.debug("Concave obstacles: %d, basic obstacles: %d", num_concave, num_basic)
         
         # 위치 계획
         positions = self._plan_obstacle_positions(config.num_total_obstacles)
         
-        obstacle_metadata = []
-        
-        # Concave 장애물 생성
-        for i in range(num_concave):
-            if i < len(positions):
-                position = positions[i]
-                
-                try:
-                    obstacle, metadata = self._create_concave_obstacle(W, position, config)
-                    if obstacle:
-                        obstacles.append(obstacle)
-                        obstacle_metadata.append(metadata)
-                except Exception as e:
-                    print(f"Failed to create concave obstacle {i}: {e}")
-                    continue
-        
-        # 기존 타입 장애물 생성 (혼합 모드인 경우)
-        if config.use_mixed_obstacles and num_basic > 0:
-            used_positions = positions[:num_concave]
-            
-            for i in range(num_basic):
-                pos_idx = num_concave + i
-                if pos_idx < len(positions):
-                    position = positions[pos_idx]
-                    
-                    try:
-                        obstacle, metadata = self._create_basic_obstacle(W, position, config)
-                        if obstacle:
-                            obstacles.append(obstacle)
-                            obstacle_metadata.append(metadata)
-                    except Exception as e:
-                        print(f"Failed to create basic obstacle {i}: {e}")
-                        continue
+        # 선택 가능한 concave 형태는 환경마다 한 번만 계산하고, 형태 이름도 한 번에 추첨
+        candidates = self._shapes_matching(config.concave_types)
+        num_placed_concave = min(num_concave, len(positions)) if candidates else 0
+        num_placed_basic = min(num_basic, len(positions) - num_placed_concave) if config.use_mixed_obstacles else 0
+        shape_names = random.choices(candidates, k=num_placed_concave) if num_placed_concave else []
+        
+        # 위치마다 장애물 종류(concave 여부)를 미리 정해 한 번 섞고, 종류에 맞춰 한 루프에서 생성
+        is_concave = [True] * num_placed_concave + [False] * num_placed_basic
+        random.shuffle(is_concave)
+        names = iter(shape_names)
+        slot_shapes = [next(names) if concave else None for concave in is_concave]
+        
+        # 위치마다 슬롯을 미리 할당해 인덱스로 채우고, 건너뛰거나 실패한 슬롯(None)은 마지막에 제거
+        slots = [None] * len(is_concave)
+        obstacle_batch = ObstacleBatch.allocate(len(is_concave))
+        
+        # 위치/형태 조건은 루프 전에 한 번에 확인 (생성 루프에는 예외 처리를 두지 않음)
+        valid = self._valid_obstacle_slots(positions, slot_shapes)
+        
+        for i, concave in enumerate(is_concave):
+            if not valid[i]:
+                continue
+            if concave:
+                obstacle = self._create_concave_obstacle(W, positions[i], config, obstacle_batch, i,
+                                                         slot_shapes[i], static_root)
+            else:
+                obstacle = self._create_basic_obstacle(W, positions[i], config, obstacle_batch, i, static_root)
+            slots[i] = obstacle or None
+        
+        created = np.array([obstacle is not None for obstacle in slots], dtype=bool)
+        obstacles = [obstacle for obstacle in slots if obstacle is not None]
+        num_created_concave = int(np.count_nonzero(created & np.array(is_concave, dtype=bool)))
         
         # 환경 메타데이터 생성
         environment_metadata = {
             'environment_type': 'mixed_concave',
             'total_obstacles': len(obstacles),
-            'concave_count': num_concave,
-            'basic_count': len(obstacles) - num_concave,
+            'concave_count': num_created_concave,
+            'basic_count': len(obstacles) - num_created_concave,
             'concave_ratio': config.concave_ratio,
             'concave_types_used': config.concave_types,
             'configuration': {
@@ -179,117 +354,155 @@ class ConcaveEnvironmentGenerator:
                 'allow_scaling': config.allow_scaling,
                 'use_mixed_obstacles': config.use_mixed_obstacles
             },
-            'obstacles': obstacle_metadata,
+            'obstacles': obstacle_batch.compress(created).to_dict(),
             'workspace_bounds': config.workspace_bounds
         }
         
-        print(f"Successfully created {len(obstacles)} obstacles")
+        log.debug("Successfully created %d obstacles", len(obstacles))
         return W, obstacles, environment_metadata
     
-    def generate_concave_only_environment(self, config: ConcaveEnvironmentConfig) -> Tuple[world, List, Dict]:
+    def _valid_obstacle_slots(self, positions: List[Tuple[float, float]],
+                              slot_shapes: List[Optional[str]]) -> List[bool]:
+        """슬롯마다 위치가 장애물 경계 안의 유한한 값이고 concave 형태가 라이브러리에 있는지"""
+        min_x, max_x, min_y, max_y = self.obstacle_bounds
+        pos = np.asarray(positions[:len(slot_shapes)], dtype=np.float64).reshape(-1, 2)
+        valid = (np.isfinite(pos).all(1)
+                 & (pos[:, 0] >= min_x) & (pos[:, 0] <= max_x)
+                 & (pos[:, 1] >= min_y) & (pos[:, 1] <= max_y)).tolist()
+        
+        for i, shape_name in enumerate(slot_shapes):
+            if shape_name is not None and self.concave_adapter.get_shape(shape_name) is None:
+                valid[i] = False
+            if not valid[i]:
+                log.warning(f"Skipping obstacle {i}: invalid position {positions[i]} or shape {shape_name}")
+        
+        return valid
+    
+    def generate_concave_only_environment(self, config: ConcaveEnvironmentConfig,
+                                          seed: Optional[int] = None) -> Tuple[world, List, Dict]:
         """Concave 장애물만으로 구성된 환경 생성"""
         
         config.use_mixed_obstacles = False
         config.concave_ratio = 1.0
         
-        return self.generate_mixed_environment(config)
+        return self.generate_mixed_environment(config, seed)
     
     def _plan_obstacle_positions(self, num_obstacles: int) -> List[Tuple[float, float]]:
-        """장애물 위치 계획"""
+        """
+        장애물 위치 계획 (Bridson Poisson disk 샘플링)
+        
+        셀 크기 min_distance/sqrt(2) 격자(셀당 최대 한 점)로 주변 5x5 셀만 검사해서
+        작업공간을 최대한 채운 뒤, 그중 num_obstacles개를 랜덤으로 선택
+        """
         
         min_x, max_x, min_y, max_y = self.obstacle_bounds
-        positions = []
-        max_attempts = 1000
+        robot_x, robot_y = self.robot_base_pos
         min_distance = 2.0  # 장애물 간 최소 거리
-        
-        for _ in range(max_attempts):
-            if len(positions) >= num_obstacles:
-                break
-            
-            x = random.uniform(min_x, max_x)
-            y = random.uniform(min_y, max_y)
-            
-            # 로봇과의 거리 확인
-            robot_distance = math.sqrt((x - self.robot_base_pos[0])**2 + 
-                                     (y - self.robot_base_pos[1])**2)
-            if robot_distance < 2.0:
-                continue
-            
-            # 다른 장애물과의 거리 확인
-            valid = True
-            for px, py in positions:
-                distance = math.sqrt((x - px)**2 + (y - py)**2)
-                if distance < min_distance:
-                    valid = False
-                    break
-            
-            if valid:
-                positions.append((x, y))
-        
-        return positions
+        k = 30  # 활성 점마다 시도할 후보 수
+        outer = 1.2  # 후보 고리 바깥 반지름 배율 (Bridson 원본의 2배보다 촘촘하게 채움)
+        
+        # 격자 셀당 최대 한 점, 반복마다 점 하나 추가 또는 활성 점 하나 제거
+        cell = min_distance / math.sqrt(2)
+        max_points = (int((max_x - min_x) / cell) + 1) * (int((max_y - min_y) / cell) + 1)
+        max_iter = 2 * max_points
+        
+        # 루프는 컴파일된 함수에서 돌리고 난수는 self._rng에서 배열로 미리 뽑음 (시드 재현성 유지)
+        rng = self._rng
+        seeds = rng.uniform((min_x, min_y), (max_x, max_y), size=(k, 2))
+        u_index = rng.random(max_iter)
+        u_radius = rng.random((max_iter, k))
+        u_angle = rng.random((max_iter, k))
+        
+        out = np.empty((max_points, 2))
+        count = _poisson_disk_fill((float(min_x), float(max_x), float(min_y), float(max_y)),
+                                   float(robot_x), float(robot_y), min_distance, outer,
+                                   seeds, u_index, u_radius, u_angle, out)
+        points = list(map(tuple, out[:count].tolist()))
+        
+        if len(points) > num_obstacles:
+            # 시작점 주변에 몰리지 않도록 전체에서 랜덤 선택
+            chosen = rng.choice(len(points), num_obstacles, replace=False)
+            points = [points[j] for j in chosen.tolist()]
+        
+        return points
     
     def _create_concave_obstacle(self, world_obj: world, position: Tuple[float, float], 
-                                config: ConcaveEnvironmentConfig) -> Tuple[Optional[staticBody], Dict]:
-        """Concave 장애물 생성"""
-        
-        # 사용 가능한 형태에서 랜덤 선택
-        available_shapes = [name for name in self.concave_adapter.list_shapes() 
-                          if any(shape_type in name for shape_type in config.concave_types)]
-        
-        if not available_shapes:
-            # 사용 가능한 형태가 없으면 모든 형태에서 선택
-            available_shapes = self.concave_adapter.list_shapes()
-        
-        if not available_shapes:
-            return None, {}
+                                config: ConcaveEnvironmentConfig,
+                                batch: ObstacleBatch, index: int, shape_name: str,
+                                static_root: Optional[staticBody] = None) -> Optional[Union[staticBody, List]]:
+        """
+        Concave 장애물 생성 (메타데이터는 batch의 index 위치에 기록)
         
-        shape_name = random.choice(available_shapes)
+        Args:
+            shape_name: 미리 추첨한 형태 이름
+            static_root: 주어지면 새 body 대신 이 body에 fixture로 추가하고 fixture 리스트 반환
+        """
         
-        # 크기와 회전 결정
+        # 크기와 회전 결정 (양자화해서 같은 형태의 변환 결과를 캐시에서 재사용)
         scale = random.uniform(*config.size_range) if config.allow_scaling else 1.0
         rotation = random.uniform(0, 2 * math.pi) if config.allow_rotation else 0.0
+        if config.allow_scaling and config.scale_step > 0:
+            # 반올림으로 size_range 밖(0 포함)으로 나가지 않도록 범위 안으로 자름
+            min_size, max_size = config.size_range
+            scale = min(max(round(scale / config.scale_step) * config.scale_step, min_size), max_size)
+        if config.rotation_step > 0:
+            rotation = round(rotation / config.rotation_step) * config.rotation_step
+        
+        # Body 생성 (또는 공용 정적 body에 fixture 추가)
+        if static_root is not None:
+            obstacle = self.concave_adapter.attach_library_shape(
+                static_root, shape_name, position, scale, rotation, method='auto'
+            )
+            num_fixtures = len(obstacle) if obstacle else 0
+        else:
+            obstacle = self.concave_adapter.create_body_from_library(
+                world_obj, shape_name, position, scale, rotation, method='auto'
+            )
+            num_fixtures = len(obstacle.fixtures) if obstacle else 0
         
-        # Body 생성
-        body = self.concave_adapter.create_body_from_library(
-            world_obj, shape_name, position, scale, rotation, method='auto'
-        )
-        
-        # 메타데이터
-        shape_data = self.concave_adapter.get_shape(shape_name)
-        metadata = {
-            'type': 'concave',
-            'shape_name': shape_name,
-            'shape_type': shape_data.shape_type if shape_data else 'unknown',
-            'position': position,
-            'scale': scale,
-            'rotation': rotation,
-            'num_fixtures': len(body.fixtures) if body else 0
-        }
+        batch.record(index, position, 'concave', shape_name, scale, rotation, num_fixtures)
         
-        return body, metadata
+        return obstacle
     
     def _create_basic_obstacle(self, world_obj: world, position: Tuple[float, float],
-                              config: ConcaveEnvironmentConfig) -> Tuple[Optional[staticBody], Dict]:
-        """기존 타입 장애물 생성"""
+                              config: ConcaveEnvironmentConfig,
+                              batch: ObstacleBatch, index: int,
+                              static_root: Optional[staticBody] = None) -> Optional[Union[staticBody, List]]:
+        """기존 타입 장애물 생성 (static_root가 주어지면 그 body에 fixture로 추가, 메타데이터는 batch에 기록)"""
         
         obstacle_type = random.choice(['rectangle', 'circle'])
         
-        if obstacle_type == 'rectangle':
-            return self.basic_generator._create_random_rectangle(world_obj, position), {
-                'type': 'rectangle',
-                'position': position
-            }
+        if static_root is not None:
+            obstacle = self._attach_basic_obstacle(static_root, obstacle_type, position)
+            num_fixtures = len(obstacle)
         else:
-            return self.basic_generator._create_random_circle(world_obj, position), {
-                'type': 'circle',
-                'position': position
-            }
+            if obstacle_type == 'rectangle':
+                obstacle = self.basic_generator._create_random_rectangle(world_obj, position)
+            else:
+                obstacle = self.basic_generator._create_random_circle(world_obj, position)
+            num_fixtures = len(obstacle.fixtures)
+        
+        batch.record(index, position, obstacle_type, num_fixtures=num_fixtures)
+        
+        return obstacle
+    
+    def _attach_basic_obstacle(self, body: staticBody, obstacle_type: str,
+                               position: Tuple[float, float]) -> List:
+        """RandomEnvironmentGenerator와 같은 크기/설정으로 사각형/원을 원점 body에 fixture로 추가"""
+        x, y = position
+        generator = self.basic_generator
+        
+        if obstacle_type == 'rectangle':
+            width, height, angle = generator._random_rectangle_params()
+            return [body.CreatePolygonFixture(box=(width/2, height/2, (x, y), angle), **generator.FIXTURE_KWARGS)]
+        
+        radius = generator._random_circle_radius()
+        return [body.CreateCircleFixture(radius=radius, pos=(x, y), **generator.FIXTURE_KWARGS)]
     
     def generate_predefined_config(self, preset: str) -> ConcaveEnvironmentConfig:
         """미리 정의된 설정 생성"""
         
-        available_types = list(set(name.split('_')[0] + '_' + name.split('_')[1] 
-                                 for name in self.concave_adapter.list_shapes()))
+        available_types = list(self._shape_types)
         
         presets = {
             'simple_concave': ConcaveEnvironmentConfig(
@@ -338,12 +551,15 @@ class ConcaveEnvironmentGenerator:
     
     def list_available_shapes(self) -> List[str]:
         """사용 가능한 concave 형태 목록"""
-        return self.concave_adapter.list_shapes()
+        return list(self._all_shapes)
     
     def get_shape_types(self) -> List[str]:
         """사용 가능한 형태 타입들"""
-        return list(set(name.split('_')[0] + '_' + name.split('_')[1] 
-                       for name in self.concave_adapter.list_shapes()))
+        return list(self._shape_types)
+
+
+# (라이브러리 파일, 작업공간 경계, 로봇 베이스 위치) -> 생성기 (라이브러리 로드를 호출 간 재사용)
+_generator_cache: Dict[Tuple[str, Tuple[float, float, float, float], Tuple[float, float]], ConcaveEnvironmentGenerator] = {}
 
 
 def create_concave_environment(preset: str = 'simple_concave',
@@ -355,23 +571,33 @@ def create_concave_environment(preset: str = 'simple_concave',
     Args:
         preset: 'simple_concave', 'complex_concave', 'concave_only', 'maze_like'
         concave_library_file: concave 형태 라이브러리 파일
-        seed: 랜덤 시드
+        seed: 랜덤 시드 (환경 생성 직전에 적용)
         
     Returns:
         (Box2D world, obstacle_list, metadata)
     """
     
-    generator = ConcaveEnvironmentGenerator(
-        concave_library_file=concave_library_file,
-        seed=seed
-    )
+    workspace_bounds = (0, 10, 0, 8)
+    robot_base_pos = (0, 0)
+    key = (concave_library_file, workspace_bounds, robot_base_pos)
+    
+    generator = _generator_cache.get(key)
+    if generator is None:
+        generator = ConcaveEnvironmentGenerator(
+            concave_library_file=concave_library_file,
+            workspace_bounds=workspace_bounds,
+            robot_base_pos=robot_base_pos
+        )
+        _generator_cache[key] = generator
     
     config = generator.generate_predefined_config(preset)
     
-    return generator.generate_mixed_environment(config)
+    return generator.generate_mixed_environment(config, seed)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # 테스트 실행
     print("Testing Concave Environment Generator...")
     
@@ -27,6 +27,49 @@ except ImportError:
     SHAPELY_AVAILABLE = False
     print("Warning: Shapely not available. Some concave generation methods will be limited.")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _offset_midpoints(template, count, draws, threshold, factor):
+    """
+    각 변 뒤에 (draws[i] < threshold인 변마다, 최대 count개) 변 중점을 중심 (0.5, 0.5)에서
+    멀어지는 방향으로 factor만큼 옮긴 점을 끼워 넣음 (factor < 0이면 중심 방향, numba로 컴파일되는 본체)
+    """
+    n = len(template)
+    out = np.empty((n + count, 2))
+    k = 0
+    added = 0
+    
+    for i in range(n):
+        out[k, 0] = template[i, 0]
+        out[k, 1] = template[i, 1]
+        k += 1
+        
+        if added < count and draws[i] < threshold:
+            next_i = (i + 1) % n
+            mid_x = (template[i, 0] + template[next_i, 0]) / 2
+            mid_y = (template[i, 1] + template[next_i, 1]) / 2
+            
+            dx = mid_x - 0.5
+            dy = mid_y - 0.5
+            length = math.sqrt(dx*dx + dy*dy)
+            
+            if length > 0:
+                out[k, 0] = mid_x + dx / length * factor
+                out[k, 1] = mid_y + dy / length * factor
+                k += 1
+                added += 1
+    
+    return out[:k]
+
+
+if NUMBA_AVAILABLE:
+    _offset_midpoints = njit(_offset_midpoints)
+
 
 class ConcaveShapeType(Enum):
     """Concave 형태 타입"""
@@ -71,33 +114,33 @@ class ConcaveShapeGenerator:
         self._init_templates()
     
     def _init_templates(self):
-        """기본 템플릿 초기화"""
+        """기본 템플릿 초기화 ((N, 2) float64 배열, 변환 시 배열 연산 한 번으로 처리)"""
         
         # L자 형태 템플릿 (정규화된 좌표)
-        self.l_template = [
+        self.l_template = np.array([
             (0, 0), (0.7, 0), (0.7, 0.3), (0.3, 0.3), (0.3, 1.0), (0, 1.0)
-        ]
+        ], dtype=np.float64)
         
         # T자 형태 템플릿
-        self.t_template = [
+        self.t_template = np.array([
             (0, 0), (1.0, 0), (1.0, 0.3), (0.65, 0.3), (0.65, 1.0), (0.35, 1.0), (0.35, 0.3), (0, 0.3)
-        ]
+        ], dtype=np.float64)
         
         # U자 형태 템플릿
-        self.u_template = [
+        self.u_template = np.array([
             (0, 0), (0.3, 0), (0.3, 0.7), (0.7, 0.7), (0.7, 0), (1.0, 0), 
             (1.0, 1.0), (0, 1.0)
-        ]
+        ], dtype=np.float64)
         
         # C자 형태 템플릿 (원호 근사)
-        self.c_template = self._generate_c_shape_template()
+        self.c_template = np.array(self._generate_c_shape_template(), dtype=np.float64)
         
         # 십자 형태 템플릿
-        self.cross_template = [
+        self.cross_template = np.array([
             (0.35, 0), (0.65, 0), (0.65, 0.35), (1.0, 0.35), (1.0, 0.65),
             (0.65, 0.65), (0.65, 1.0), (0.35, 1.0), (0.35, 0.65), (0, 0.65),
             (0, 0.35), (0.35, 0.35)
-        ]
+        ], dtype=np.float64)
     
     def _generate_c_shape_template(self) -> List[Tuple[float, float]]:
         """C자 형태 템플릿 생성 (원호 기반)"""
@@ -230,20 +273,18 @@ class ConcaveShapeGenerator:
         outer_radius = 0.5
         inner_radius = 0.2
         
-        points = []
-        for i in range(num_points * 2):
-            angle = 2 * math.pi * i / (num_points * 2)
-            radius = outer_radius if i % 2 == 0 else inner_radius
-            
-            # 복잡도에 따른 반지름 변화
-            if config.complexity == 'medium':
-                radius *= random.uniform(0.8, 1.2)
-            elif config.complexity == 'complex':
-                radius *= random.uniform(0.6, 1.4)
-            
-            x = 0.5 + radius * math.cos(angle)
-            y = 0.5 + radius * math.sin(angle)
-            points.append((x, y))
+        # 꼭지점(짝수)/안쪽 점(홀수)의 각도와 반지름을 배열로 한 번에 계산
+        i = np.arange(num_points * 2)
+        angles = np.pi * i / num_points
+        radii = np.where(i % 2 == 0, outer_radius, inner_radius)
+        
+        # 복잡도에 따른 반지름 변화
+        if config.complexity == 'medium':
+            radii = radii * np.random.uniform(0.8, 1.2, size=radii.shape)
+        elif config.complexity == 'complex':
+            radii = radii * np.random.uniform(0.6, 1.4, size=radii.shape)
+        
+        points = 0.5 + np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
         
         return self._transform_template(points, config, position)
     
@@ -257,28 +298,16 @@ class ConcaveShapeGenerator:
         inner_radius = 0.1
         width = 0.05  # 나선 두께
         
-        points = []
-        
-        # 외부 나선
-        for i in range(total_points):
-            t = i / points_per_turn
-            angle = 2 * math.pi * t
-            radius = outer_radius - (outer_radius - inner_radius) * t / num_turns
-            
-            x = 0.5 + radius * math.cos(angle)
-            y = 0.5 + radius * math.sin(angle)
-            points.append((x, y))
+        # 외부 나선 (t: 회전 수), 내부 나선은 같은 t를 역방향으로
+        t = np.arange(total_points) / points_per_turn
+        t_inner = t[::-1]
+        angles = 2 * math.pi * np.concatenate((t, t_inner))
+        radii = np.concatenate((
+            outer_radius - (outer_radius - inner_radius) * t / num_turns,
+            np.maximum(outer_radius - (outer_radius - inner_radius) * t_inner / num_turns - width, inner_radius)
+        ))
         
-        # 내부 나선 (역방향)
-        for i in range(total_points):
-            t = (total_points - 1 - i) / points_per_turn
-            angle = 2 * math.pi * t
-            radius = outer_radius - (outer_radius - inner_radius) * t / num_turns - width
-            radius = max(radius, inner_radius)
-            
-            x = 0.5 + radius * math.cos(angle)
-            y = 0.5 + radius * math.sin(angle)
-            points.append((x, y))
+        points = 0.5 + np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
         
         return self._transform_template(points, config, position)
     
@@ -397,77 +426,21 @@ class ConcaveShapeGenerator:
         except:
             return self._generate_cross_shape(config, position)
     
-    def _add_indentations(self, template: List[Tuple[float, float]], count: int) -> List[Tuple[float, float]]:
-        """템플릿에 들여쓰기 추가"""
+    def _add_indentations(self, template: Union[List[Tuple[float, float]], np.ndarray], count: int) -> np.ndarray:
+        """템플릿에 들여쓰기 추가 (변 중점을 중심 방향으로 0.05, 변마다 30% 확률)"""
         if len(template) < 4:
             return template
         
-        new_points = []
-        added_count = 0
-        
-        for i in range(len(template)):
-            new_points.append(template[i])
-            
-            if added_count < count and random.random() < 0.3:
-                # 다음 점과의 중점에서 들여쓰기 생성
-                next_i = (i + 1) % len(template)
-                mid_x = (template[i][0] + template[next_i][0]) / 2
-                mid_y = (template[i][1] + template[next_i][1]) / 2
-                
-                # 중심 방향으로 들여쓰기
-                center_x, center_y = 0.5, 0.5
-                indent_factor = 0.05
-                
-                dx = center_x - mid_x
-                dy = center_y - mid_y
-                length = math.sqrt(dx*dx + dy*dy)
-                
-                if length > 0:
-                    dx /= length
-                    dy /= length
-                    
-                    indent_x = mid_x + dx * indent_factor
-                    indent_y = mid_y + dy * indent_factor
-                    new_points.append((indent_x, indent_y))
-                    added_count += 1
-        
-        return new_points
-    
-    def _add_protrusions(self, template: List[Tuple[float, float]], count: int) -> List[Tuple[float, float]]:
-        """템플릿에 돌출부 추가"""
+        template = np.ascontiguousarray(template, dtype=np.float64).reshape(-1, 2)
+        return _offset_midpoints(template, count, np.random.random(len(template)), 0.3, -0.05)
+    
+    def _add_protrusions(self, template: Union[List[Tuple[float, float]], np.ndarray], count: int) -> np.ndarray:
+        """템플릿에 돌출부 추가 (변 중점을 중심 반대 방향으로 0.08, 변마다 20% 확률)"""
         if len(template) < 4:
             return template
         
-        new_points = []
-        added_count = 0
-        
-        for i in range(len(template)):
-            new_points.append(template[i])
-            
-            if added_count < count and random.random() < 0.2:
-                # 돌출부 생성
-                next_i = (i + 1) % len(template)
-                mid_x = (template[i][0] + template[next_i][0]) / 2
-                mid_y = (template[i][1] + template[next_i][1]) / 2
-                
-                # 중심 반대 방향으로 돌출
-                center_x, center_y = 0.5, 0.5
-                protrusion_factor = 0.08
-                
-                dx = mid_x - center_x
-                dy = mid_y - center_y
-                length = math.sqrt(dx*dx + dy*dy)
-                
-                if length > 0:
-                    dx /= length
-                    dy /= length
-                    
-                    prot_x = mid_x + dx * protrusion_factor
-                    prot_y = mid_y + dy * protrusion_factor
-                    new_points.append((prot_x, prot_y))
-                    added_count += 1
-        
-        return new_points
+        template = np.ascontiguousarray(template, dtype=np.float64).reshape(-1, 2)
+        return _offset_midpoints(template, count, np.random.random(len(template)), 0.2, 0.08)
     
     def _generate_maze_pattern(self, size: int, complexity: str) -> List[List[bool]]:
         """미로 패턴 생성 (True = 벽, False = 빈공간)"""
@@ -514,37 +487,27 @@ class ConcaveShapeGenerator:
         
         return points
     
-    def _transform_template(self, template: List[Tuple[float, float]], 
+    def _transform_template(self, template: Union[List[Tuple[float, float]], np.ndarray], 
                           config: ConcaveShapeConfig, 
                           position: Tuple[float, float]) -> List[Tuple[float, float]]:
-        """템플릿을 설정에 따라 변환"""
-        transformed = []
-        
+        """템플릿을 설정에 따라 변환 (중심 이동 -> 스케일 -> 회전 -> 위치 이동을 (N, 2) 배열 연산으로)"""
         size = random.uniform(*config.size_range)
-        cx, cy = position
         
-        for x, y in template:
-            # 중심을 (0.5, 0.5)에서 (0, 0)으로 이동
-            x -= 0.5
-            y -= 0.5
-            
-            # 스케일 적용
-            x *= config.scale_x * size
-            y *= config.scale_y * size
-            
-            # 회전 적용
-            cos_r = math.cos(config.rotation)
-            sin_r = math.sin(config.rotation)
-            x_rot = x * cos_r - y * sin_r
-            y_rot = x * sin_r + y * cos_r
-            
-            # 위치 이동
-            x_final = x_rot + cx
-            y_final = y_rot + cy
-            
-            transformed.append((x_final, y_final))
+        # 중심을 (0.5, 0.5)에서 (0, 0)으로 이동
+        points = np.asarray(template, dtype=np.float64).reshape(-1, 2) - 0.5
+        
+        # 스케일과 회전을 하나의 2x2 행렬로
+        cos_r = math.cos(config.rotation)
+        sin_r = math.sin(config.rotation)
+        sx = config.scale_x * size
+        sy = config.scale_y * size
+        matrix = np.array([[cos_r * sx, -sin_r * sy],
+                           [sin_r * sx, cos_r * sy]])
+        
+        transformed = points @ matrix.T
+        transformed += position
         
-        return transformed
+        return list(map(tuple, transformed.tolist()))
     
     def generate_random_config(self, shape_type: Optional[ConcaveShapeType] = None) -> ConcaveShapeConfig:
         """랜덤한 concave 형태 설정 생성"""
@@ -11,6 +11,7 @@ import argparse
 import sys
 import os
 import datetime
+import numpy as np
 
 # 상위 디렉토리를 path에 추가하여 모듈 import 가능하도록 설정
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -138,7 +139,8 @@ def main():
     print("Extracting pointcloud...")
     workspace_bounds = tuple(args.workspace_bounds)
     
-    points = extractor.extract_from_world(world, workspace_bounds)
+    noise_rng = np.random.default_rng(args.seed) if args.seed is not None else None
+    points = extractor.extract_from_world(world, workspace_bounds, rng=noise_rng)
     print(f"Extracted {len(points)} points")
     
     # 4. 메타데이터 준비 (클러스터링 설정 + 환경 정보 포함)
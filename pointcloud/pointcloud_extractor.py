@@ -10,7 +10,7 @@ import json
 import datetime
 from typing import List, Tuple, Optional, Dict
 from Box2D.b2 import world as Box2D_world, staticBody, circleShape
-import matplotlib.pyplot as plt
+from ply_io import encode_ply_points
 
 
 class PointcloudExtractor:
@@ -28,95 +28,93 @@ class PointcloudExtractor:
         self.noise_level = noise_level
         self.data_dir = data_dir
         
+        # workspace_bounds -> (x 개수, y 개수, grid_x, grid_y) 스캔 그리드 캐시
+        self._grid_cache = {}
+        
         # 데이터 디렉토리 생성
         os.makedirs(data_dir, exist_ok=True)
     
     def extract_from_world(self, world: Box2D_world, 
-                          workspace_bounds: Tuple[float, float, float, float]) -> np.ndarray:
+                          workspace_bounds: Tuple[float, float, float, float],
+                          rng: Optional[np.random.Generator] = None) -> np.ndarray:
         """
         Box2D 월드에서 포인트클라우드 추출
         
         Args:
             world: Box2D 월드 객체
             workspace_bounds: (min_x, max_x, min_y, max_y) 작업공간 경계
+            rng: 노이즈용 난수 생성기 (None이면 전역 np.random)
             
         Returns:
             points: (N, 2) 포인트클라우드 배열
         """
-        min_x, max_x, min_y, max_y = workspace_bounds
-        
-        # 그리드 생성
-        x_coords = np.arange(min_x, max_x + self.resolution, self.resolution)
-        y_coords = np.arange(min_y, max_y + self.resolution, self.resolution)
-        
-        points = []
+        num_x, num_y, grid_x, grid_y = self.get_scan_grid(workspace_bounds)
         
-        print(f"Scanning {len(x_coords)}x{len(y_coords)} grid points...")
+        total_points = len(grid_x)
+        print(f"Scanning {num_x}x{num_y} grid points...")
         
-        # 진행률 표시
-        total_points = len(x_coords) * len(y_coords)
-        processed = 0
+        # 모든 그리드 포인트에 대해 장애물 내부 여부를 한 번에 계산
+        inside = self._obstacle_mask(world, grid_x, grid_y)
         
-        for i, x in enumerate(x_coords):
-            if i % max(1, len(x_coords) // 10) == 0:
-                progress = processed / total_points * 100
-                print(f"Progress: {progress:.1f}%")
-            
-            for y in y_coords:
-                # 각 그리드 포인트에서 장애물과의 충돌 검사
-                if self._is_point_in_obstacle(world, x, y):
-                    # 노이즈 추가
-                    noisy_x = x + np.random.normal(0, self.noise_level)
-                    noisy_y = y + np.random.normal(0, self.noise_level)
-                    points.append([noisy_x, noisy_y])
-                
-                processed += 1
+        # 노이즈 추가
+        points = np.column_stack((grid_x[inside], grid_y[inside]))
+        points += (np.random if rng is None else rng).normal(0, self.noise_level, size=points.shape)
         
         print(f"Extracted {len(points)} points from {total_points} grid points")
-        return np.array(points)
+        return points
     
-    def _is_point_in_obstacle(self, world: Box2D_world, x: float, y: float) -> bool:
-        """점이 장애물 내부에 있는지 확인"""
-        for body in world.bodies:
-            if body.type == staticBody:
-                # 각 fixture 확인
-                for fixture in body.fixtures:
-                    if self._point_in_fixture(fixture, body, x, y):
-                        return True
-        return False
+    def get_scan_grid(self, workspace_bounds: Tuple[float, float, float, float]):
+        """
+        스캔 그리드 반환 (같은 작업공간이면 환경 간 재사용)
+        
+        Returns:
+            (num_x, num_y, grid_x, grid_y): x 우선 순서로 펼친 읽기 전용 좌표 배열
+        """
+        key = tuple(workspace_bounds)
+        grid = self._grid_cache.get(key)
+        if grid is None:
+            min_x, max_x, min_y, max_y = key
+            x_coords = np.arange(min_x, max_x + self.resolution, self.resolution)
+            y_coords = np.arange(min_y, max_y + self.resolution, self.resolution)
+            grid_x, grid_y = np.meshgrid(x_coords, y_coords, indexing='ij')
+            grid_x = grid_x.ravel()
+            grid_y = grid_y.ravel()
+            grid_x.flags.writeable = False
+            grid_y.flags.writeable = False
+            grid = self._grid_cache[key] = (len(x_coords), len(y_coords), grid_x, grid_y)
+        return grid
     
-    def _point_in_fixture(self, fixture, body, x: float, y: float) -> bool:
-        """점이 특정 fixture 내부에 있는지 확인"""
-        # 월드 좌표를 바디 로컬 좌표로 변환
-        local_point = body.GetLocalPoint((x, y))
-        
-        if hasattr(fixture.shape, 'radius'):
-            # 원형 장애물
-            center = fixture.shape.pos
-            radius = fixture.shape.radius
-            distance = np.sqrt((local_point.x - center.x)**2 + (local_point.y - center.y)**2)
-            return distance <= radius
-        
-        elif hasattr(fixture.shape, 'vertices'):
-            # 다각형 장애물 - 점이 다각형 내부에 있는지 ray casting 알고리즘 사용
-            vertices = fixture.shape.vertices
-            return self._point_in_polygon(local_point.x, local_point.y, vertices)
-        
-        return False
+    def _obstacle_mask(self, world: Box2D_world, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """각 점이 정적 장애물 내부에 있는지 벡터화해서 확인 (월드 좌표)"""
+        inside = np.zeros(len(xs), dtype=bool)
+        
+        for body in world.bodies:
+            if body.type != staticBody:
+                continue
+            for fixture in body.fixtures:
+                shape = fixture.shape
+                if isinstance(shape, circleShape):
+                    # 원형 장애물
+                    cx, cy = body.GetWorldPoint(shape.pos)
+                    inside |= (xs - cx)**2 + (ys - cy)**2 <= shape.radius**2
+                elif hasattr(shape, 'vertices'):
+                    # 다각형 장애물 - ray casting (변 단위 루프, 점은 벡터화)
+                    vertices = [body.GetWorldPoint(v) for v in shape.vertices]
+                    inside |= self._points_in_polygon(xs, ys, vertices)
+        
+        return inside
     
-    def _point_in_polygon(self, x: float, y: float, vertices) -> bool:
-        """Ray casting 알고리즘으로 점이 다각형 내부에 있는지 확인"""
-        n = len(vertices)
-        inside = False
-        
-        j = n - 1
-        for i in range(n):
-            xi, yi = vertices[i].x, vertices[i].y
-            xj, yj = vertices[j].x, vertices[j].y
-            
-            if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
-                inside = not inside
-            j = i
+    @staticmethod
+    def _points_in_polygon(xs: np.ndarray, ys: np.ndarray, vertices) -> np.ndarray:
+        """Ray casting 알고리즘의 벡터화 버전"""
+        inside = np.zeros(len(xs), dtype=bool)
+        
+        xj, yj = vertices[-1]
+        for xi, yi in vertices:
+            # 수평 변은 교차하지 않음
+            if yi != yj:
+                inside ^= ((yi > ys) != (yj > ys)) & (xs < (xj - xi) * (ys - yi) / (yj - yi) + xi)
+            xj, yj = xi, yi
         
         return inside
     
@@ -130,26 +128,26 @@ class PointcloudExtractor:
             filename: 파일명 (확장자 제외)
             metadata: 메타데이터 (JSON으로 별도 저장)
             
+        Returns:
+            저장된 PLY 파일 경로
+        """
+        # PLY 파일 저장 (binary little-endian, 포인트 데이터는 한 번에 기록)
+        return self.save_encoded_pointcloud(encode_ply_points(points), filename, metadata)
+    
+    def save_encoded_pointcloud(self, ply_bytes: bytes, filename: str,
+                                metadata: Optional[Dict] = None) -> str:
+        """
+        encode_ply_points로 미리 인코딩된 PLY 바이트를 저장
+        (워커에서 인코딩하고 메인 프로세스에서만 파일을 쓰는 배치 생성용)
+        
         Returns:
             저장된 PLY 파일 경로
         """
         # 파일 경로 설정
         ply_path = os.path.join(self.data_dir, f"{filename}.ply")
         
-        # PLY 파일 저장
-        with open(ply_path, 'w') as f:
-            # PLY 헤더
-            f.write("ply\n")
-            f.write("format ascii 1.0\n")
-            f.write(f"element vertex {len(points)}\n")
-            f.write("property float x\n")
-            f.write("property float y\n")
-            f.write("property float z\n")
-            f.write("end_header\n")
-            
-            # 포인트 데이터
-            for point in points:
-                f.write(f"{point[0]:.6f} {point[1]:.6f} 0.000000\n")
+        with open(ply_path, 'wb') as f:
+            f.write(ply_bytes)
         
         # 메타데이터 저장
         if metadata is not None:
@@ -162,6 +160,9 @@ class PointcloudExtractor:
     
     def visualize_pointcloud(self, points: np.ndarray, title: str = "Pointcloud") -> None:
         """포인트클라우드 시각화"""
+        # pyplot은 시각화할 때만 import (배치 생성 워커 시작 시 import 비용 제거)
+        import matplotlib.pyplot as plt
+        
         plt.figure(figsize=(12, 8))
         plt.scatter(points[:, 0], points[:, 1], s=1, alpha=0.6, c='blue')
         plt.title(title)
@@ -7,12 +7,20 @@ Pointcloud Loader Module
 import numpy as np
 import os
 import json
+import copy
 import Box2D
 from typing import List, Tuple, Optional, Union
 from sklearn.cluster import DBSCAN
 from scipy.spatial import ConvexHull
 import warnings
 
+from ply_io import read_ply_points
+
+
+# 파싱된 포인트클라우드 캐시: ply 경로 -> ((ply mtime_ns, meta mtime_ns), 읽기 전용 points, metadata)
+# 같은 환경으로 반복 리셋할 때 PLY 재파싱을 피함
+_POINTCLOUD_CACHE = {}
+
 
 class PointcloudLoader:
     """포인트클라우드 파일을 로드하고 Box2D 환경으로 변환하는 클래스"""
@@ -44,35 +52,30 @@ class PointcloudLoader:
             base_filename = filename
             filepath = os.path.join(self.data_dir, f"{filename}.ply")
         
+        # PLY와 메타데이터 파일이 모두 바뀌지 않았으면 캐시된 결과 재사용
+        meta_filepath = os.path.join(self.data_dir, f"{base_filename}_meta.json")
+        meta_mtime = os.stat(meta_filepath).st_mtime_ns if os.path.exists(meta_filepath) else None
+        key = (os.stat(filepath).st_mtime_ns, meta_mtime)
+        cached = _POINTCLOUD_CACHE.get(filepath)
+        if cached is not None and cached[0] == key:
+            return cached[1], copy.deepcopy(cached[2])
+        
+        # 캐시된 배열은 공유되므로 읽기 전용으로
         points = self._load_ply(filepath)
+        points.flags.writeable = False
         
         # 메타데이터 로드 (있는 경우)
         metadata = None
-        meta_filepath = os.path.join(self.data_dir, f"{base_filename}_meta.json")
-        if os.path.exists(meta_filepath):
+        if meta_mtime is not None:
             with open(meta_filepath, 'r') as f:
                 metadata = json.load(f)
         
-        return points, metadata
+        _POINTCLOUD_CACHE[filepath] = (key, points, metadata)
+        return points, copy.deepcopy(metadata)
     
     def _load_ply(self, filepath: str) -> np.ndarray:
-        """PLY 파일 로드"""
-        points = []
-        
-        with open(filepath, 'r') as f:
-            # 헤더 스킵
-            line = f.readline()
-            while line and not line.startswith('end_header'):
-                line = f.readline()
-            
-            # 포인트 데이터 읽기
-            for line in f:
-                if line.strip():
-                    coords = line.split()
-                    x, y = float(coords[0]), float(coords[1])
-                    points.append([x, y])
-        
-        return np.array(points)
+        """PLY 파일 로드 (ascii / binary_little_endian)"""
+        return read_ply_points(filepath)
     
     def create_world_from_pointcloud(self, points: np.ndarray, 
                                    clustering_eps: float = 0.3,
@@ -21,6 +21,9 @@ from scipy.interpolate import splprep, splev
 class RandomEnvironmentGenerator:
     """랜덤 환경 생성 클래스"""
     
+    # 장애물 fixture 공통 설정
+    FIXTURE_KWARGS = {'density': 1.0, 'friction': 0.5}
+    
     def __init__(self, workspace_bounds: Tuple[float, float, float, float] = (0, 10, 0, 8),
                  robot_base_pos: Tuple[float, float] = (0, 0),
                  robot_max_reach: float = 8.0,
@@ -147,22 +150,29 @@ class RandomEnvironmentGenerator:
         
         return None
     
+    def _random_rectangle_params(self) -> Tuple[float, float, float]:
+        """랜덤 사각형 (폭, 높이, 회전 각도)"""
+        width = random.uniform(0.3, 1.2)
+        height = random.uniform(0.3, 1.0)
+        angle = random.uniform(0, 2 * math.pi)
+        return width, height, angle
+    
+    def _random_circle_radius(self) -> float:
+        """랜덤 원 반지름"""
+        return random.uniform(0.2, 0.8)
+    
     def _create_random_rectangle(self, W: world, position: Tuple[float, float]):
         """랜덤 사각형 장애물 생성"""
         x, y = position
         
-        # 랜덤 크기
-        width = random.uniform(0.3, 1.2)
-        height = random.uniform(0.3, 1.0)
-        
-        # 랜덤 회전 각도
-        angle = random.uniform(0, 2 * math.pi)
+        # 랜덤 크기와 회전 각도
+        width, height, angle = self._random_rectangle_params()
         
         # Body 생성
         body = W.CreateStaticBody(position=(x, y), angle=angle)
         
         # 사각형 fixture 생성
-        body.CreatePolygonFixture(box=(width/2, height/2), density=1.0, friction=0.5)
+        body.CreatePolygonFixture(box=(width/2, height/2), **self.FIXTURE_KWARGS)
         
         return body
     
@@ -171,13 +181,13 @@ class RandomEnvironmentGenerator:
         x, y = position
         
         # 랜덤 반지름
-        radius = random.uniform(0.2, 0.8)
+        radius = self._random_circle_radius()
         
         # Body 생성
         body = W.CreateStaticBody(position=(x, y))
         
         # 원형 fixture 생성
-        body.CreateCircleFixture(radius=radius, density=1.0, friction=0.5)
+        body.CreateCircleFixture(radius=radius, **self.FIXTURE_KWARGS)
         
         return body
     
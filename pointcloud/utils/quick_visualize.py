@@ -11,27 +11,18 @@ circle_envs_10k 디렉토리의 특정 환경을 빠르게 시각화
 
 import sys
 import os
-import numpy as np
 import matplotlib.pyplot as plt
 import json
 
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ply_io import read_ply_points
+
 
 def read_ply(filename):
     """PLY 파일에서 포인트 데이터 읽기"""
-    points = []
-    with open(filename, 'r') as f:
-        # 헤더 스킵
-        line = f.readline()
-        while not line.startswith('end_header'):
-            line = f.readline()
-        
-        # 포인트 데이터 읽기
-        for line in f:
-            if line.strip():
-                x, y, z = map(float, line.strip().split())
-                points.append([x, y])
-    
-    return np.array(points)
+    return read_ply_points(filename)
 
 
 def read_metadata(filename):
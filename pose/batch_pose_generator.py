@@ -27,6 +27,13 @@ try:
 except ImportError:
     from pose_pipeline import PosePipeline
 
+try:
+    from ply_io import read_ply_vertex_count
+except ImportError:
+    # pose/ 안에서 스크립트로 실행된 경우 상위 디렉토리를 path에 추가
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from ply_io import read_ply_vertex_count
+
 
 class BatchPoseGenerator:
     """배치 포즈 생성기"""
@@ -183,12 +190,7 @@ class BatchPoseGenerator:
         
         # PLY 파일에서 기본 정보 추출
         try:
-            with open(ply_file, 'r') as f:
-                lines = f.readlines()
-                for line in lines:
-                    if line.startswith('element vertex'):
-                        metadata['num_points'] = int(line.split()[-1])
-                        break
+            metadata['num_points'] = read_ply_vertex_count(ply_file)
         except Exception as e:
             print(f"Warning: Could not extract PLY info: {e}")
         
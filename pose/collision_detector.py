@@ -9,6 +9,8 @@ PLY 포인트클라우드 환경과 주어진 로봇 포즈 간의 충돌을 검
 3. 포인트-형태 충돌 검사 수행
 """
 
+import os
+import sys
 import numpy as np
 import math
 from typing import List, Tuple, Optional, Set
@@ -19,6 +21,13 @@ try:
 except ImportError:
     from random_pose_generator import RandomPoseGenerator, RobotGeometry
 
+try:
+    from ply_io import read_ply_points
+except ImportError:
+    # pose/ 안에서 스크립트로 실행된 경우 상위 디렉토리를 path에 추가
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from ply_io import read_ply_points
+
 
 @dataclass
 class CollisionResult:
@@ -79,25 +88,9 @@ class CollisionDetector:
             print(f"Error loading PLY file {ply_file}: {e}")
             return False
     
-    def _read_ply_file(self, ply_file: str) -> List[Tuple[float, float]]:
-        """PLY 파일에서 2D 포인트 데이터 읽기"""
-        points = []
-        
-        with open(ply_file, 'r') as f:
-            # 헤더 스킵
-            line = f.readline()
-            while not line.startswith('end_header'):
-                line = f.readline()
-            
-            # 포인트 데이터 읽기
-            for line in f:
-                if line.strip():
-                    coords = line.strip().split()
-                    if len(coords) >= 3:
-                        x, y = float(coords[0]), float(coords[1])
-                        points.append((x, y))
-        
-        return points
+    def _read_ply_file(self, ply_file: str) -> np.ndarray:
+        """PLY 파일에서 2D 포인트 데이터 읽기 (ascii / binary_little_endian)"""
+        return read_ply_points(ply_file)
     
     def check_collision(self, pose: List[float], robot_id: int, 
                        safety_margin: float = 0.05) -> CollisionResult:
@@ -25,6 +25,13 @@ try:
 except ImportError:
     from random_pose_generator import RandomPoseGenerator
 
+try:
+    from ply_io import read_ply_points
+except ImportError:
+    # pose/ 안에서 스크립트로 실행된 경우 상위 디렉토리를 path에 추가
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from ply_io import read_ply_points
+
 
 class PoseVisualizer:
     """포즈 시각화기"""
@@ -86,30 +93,7 @@ class PoseVisualizer:
             return np.array([])
         
         try:
-            points = []
-            with open(ply_file, 'r') as f:
-                lines = f.readlines()
-                
-                # 헤더 파싱
-                header_end = False
-                for i, line in enumerate(lines):
-                    if line.strip() == 'end_header':
-                        header_end = True
-                        data_start = i + 1
-                        break
-                
-                if not header_end:
-                    raise ValueError("Invalid PLY format: no end_header found")
-                
-                # 포인트 데이터 파싱
-                for line in lines[data_start:]:
-                    if line.strip():
-                        coords = line.strip().split()
-                        if len(coords) >= 2:
-                            x, y = float(coords[0]), float(coords[1])
-                            points.append([x, y])
-            
-            points_array = np.array(points)
+            points_array = read_ply_points(ply_file)
             print(f"   Environment points: {len(points_array)}")
             return points_array
             
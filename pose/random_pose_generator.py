@@ -13,6 +13,12 @@ import yaml
 from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass
 
+# 프로젝트 루트에서 실행하면 공용 ConfigLoader(C 로더 + pickle 캐시) 사용
+try:
+    from config_loader import ConfigLoader
+except ImportError:
+    ConfigLoader = None
+
 
 @dataclass
 class RobotGeometry:
@@ -44,13 +50,17 @@ class RandomPoseGenerator:
     def _load_robot_geometries(self, config_file: str) -> Dict[int, RobotGeometry]:
         """config.yaml에서 로봇 geometry 정보 로드"""
         
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        if ConfigLoader is not None:
+            robot_geometries = ConfigLoader(config_file).get_robot_geometries()
+        else:
+            with open(config_file, 'r') as f:
+                config = yaml.safe_load(f)
+            robot_geometries = config.get('robot_geometries', {})
         
         geometries = {}
         
-        if 'robot_geometries' in config:
-            for robot_id, robot_config in config['robot_geometries'].items():
+        if robot_geometries:
+            for robot_id, robot_config in robot_geometries.items():
                 geometries[int(robot_id)] = RobotGeometry(
                     robot_id=int(robot_id),
                     name=robot_config['name'],
@@ -1,11 +1,17 @@
 # record_video.py - 시뮬레이션 비디오 녹화
 import pygame, sys
+import os
 import numpy as np
 import argparse
 import cv2
 from env import make_world, list_available_pointclouds
 from simulation import RobotSimulation
-from render import draw_world
+from render import draw_world, PPM, ORIGIN
+
+# 화면 좌표 변환 상수와 색상 (매 프레임 튜플 재생성 방지)
+ORIGIN_X, ORIGIN_Y = ORIGIN
+RED = (255, 0, 0)
+WHITE = (255, 255, 255)
 
 # 명령행 인자 파싱
 def parse_args():
@@ -25,33 +31,35 @@ def parse_args():
     parser.add_argument('--policy', choices=['potential_field', 'potential_field_pd', 'rmp'], 
                         default='potential_field_pd',
                         help='Control policy (default: potential_field_pd)')
+    parser.add_argument('--vel-iters', type=int, default=6,
+                        help='Box2D velocity iterations per step, default: 6 (raise for collision-heavy pointcloud scenes)')
+    parser.add_argument('--pos-iters', type=int, default=2,
+                        help='Box2D position iterations per step, default: 2 (raise for collision-heavy pointcloud scenes)')
     
     return parser.parse_args()
 
 # target 위치 시각화 함수
-def draw_target(screen, target, PPM=50.0, ORIGIN=(100, 500)):
+def draw_target(screen, x, y):
     # 월드 좌표를 화면 좌표로 변환
-    x, y = target
-    sx = ORIGIN[0] + x * PPM
-    sy = ORIGIN[1] - y * PPM
+    sx = ORIGIN_X + int(x * PPM)
+    sy = ORIGIN_Y - int(y * PPM)
     
     # 빨간 원으로 target 그리기
-    pygame.draw.circle(screen, (255, 0, 0), (int(sx), int(sy)), 8)
+    pygame.draw.circle(screen, RED, (sx, sy), 8)
     # 중심점 표시
-    pygame.draw.circle(screen, (255, 255, 255), (int(sx), int(sy)), 2)
+    pygame.draw.circle(screen, WHITE, (sx, sy), 2)
 
 def main():
     # 1) 명령행 인자 처리
     args = parse_args()
-    target = np.array(args.target)
+    target = np.asarray(args.target, dtype=np.float64)
+    tx, ty = float(target[0]), float(target[1])
     duration = args.duration
     output_file = args.output
     fps = args.fps
     
     # Environment validation
     if args.env and args.env != 'static':
-        import os
-        
         # Convert environment name to full path: env_name -> data/env_name/env_name.ply
         env_name = args.env
         if env_name.endswith('.ply'):
@@ -89,7 +97,6 @@ def main():
     env_type = 'static' if args.env == 'static' else 'pointcloud'
     
     # simulation_videos 폴더 생성
-    import os
     results_dir = "data/results/simulation_videos"
     if not os.path.exists(results_dir):
         os.makedirs(results_dir)
@@ -128,7 +135,8 @@ def main():
     )
 
     # 시뮬레이션 객체 생성
-    simulation = RobotSimulation(world, links, obstacles, target, args.policy)
+    simulation = RobotSimulation(world, links, obstacles, target, args.policy,
+                                vel_iters=args.vel_iters, pos_iters=args.pos_iters)
 
     # 4) 비디오 작성기 설정
     fourcc = cv2.VideoWriter_fourcc(*'mp4v')
@@ -140,6 +148,9 @@ def main():
 
     print(f"Starting recording... Total frames: {total_frames}")
 
+    # HUD 폰트는 한 번만 생성
+    font = pygame.font.Font(None, 36)
+
     # 6) 메인 루프
     running = True
     while running and current_frame < total_frames:
@@ -155,15 +166,14 @@ def main():
         draw_world(screen, world, SCREEN_W, SCREEN_H)
         
         # target 위치 시각화
-        draw_target(screen, target)
+        draw_target(screen, tx, ty)
         
         # 정보 텍스트 표시
-        font = pygame.font.Font(None, 36)
         if env_type == 'pointcloud':
-            info_text = f"Target: ({target[0]:.1f}, {target[1]:.1f}) | PC: {args.env} | Frame: {current_frame}/{total_frames}"
+            info_text = f"Target: ({tx:.1f}, {ty:.1f}) | PC: {args.env} | Frame: {current_frame}/{total_frames}"
         else:
-            info_text = f"Target: ({target[0]:.1f}, {target[1]:.1f}) | Static Env | Frame: {current_frame}/{total_frames}"
-        text_surface = font.render(info_text, True, (255, 255, 255))
+            info_text = f"Target: ({tx:.1f}, {ty:.1f}) | Static Env | Frame: {current_frame}/{total_frames}"
+        text_surface = font.render(info_text, True, WHITE)
         screen.blit(text_surface, (10, 10))
         
         # 진행률 표시
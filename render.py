@@ -1,31 +1,55 @@
 # render.py
 import pygame
-from Box2D.b2 import polygonShape, circleShape
+from Box2D.b2 import polygonShape, circleShape, staticBody
 
 PPM = 50.0
 ORIGIN = (100, 500)
-def draw_world(screen, world, width, height):
-    screen.fill((30,30,30))
-    
-    for body in world.bodies:
-        for fix in body.fixtures:
-            shape = fix.shape
-            if isinstance(shape, polygonShape):
-                # 월드 좌표 → 화면 좌표 변환 함수
-                def W2S(v):
-                    x, y = body.transform * v
-                    sx = ORIGIN[0] + x * PPM
-                    sy = ORIGIN[1] - y * PPM
-                    return (int(sx), int(sy))
-                
-                verts = [W2S(v) for v in shape.vertices]
-                pygame.draw.polygon(screen, (200,200,200), verts)
-            elif isinstance(shape, circleShape):
-                # 월드 동일하게 변환
-                x, y = body.transform * shape.pos
+BACKGROUND = (30,30,30)
+
+def _draw_body(screen, body):
+    """바디의 fixture들을 그리고, 그려진 영역(Rect) 리스트를 반환"""
+    rects = []
+    for fix in body.fixtures:
+        shape = fix.shape
+        if isinstance(shape, polygonShape):
+            # 월드 좌표 → 화면 좌표 변환 함수
+            def W2S(v):
+                x, y = body.transform * v
                 sx = ORIGIN[0] + x * PPM
                 sy = ORIGIN[1] - y * PPM
-                pygame.draw.circle(
-                    screen, (200,200,200),
-                    (int(sx), int(sy)),
-                    int(shape.radius * PPM))
\ No newline at end of file
+                return (int(sx), int(sy))
+
+            verts = [W2S(v) for v in shape.vertices]
+            rects.append(pygame.draw.polygon(screen, (200,200,200), verts))
+        elif isinstance(shape, circleShape):
+            # 월드 동일하게 변환
+            x, y = body.transform * shape.pos
+            sx = ORIGIN[0] + x * PPM
+            sy = ORIGIN[1] - y * PPM
+            rects.append(pygame.draw.circle(
+                screen, (200,200,200),
+                (int(sx), int(sy)),
+                int(shape.radius * PPM)))
+    return rects
+
+def draw_world(screen, world, width, height):
+    screen.fill(BACKGROUND)
+
+    for body in world.bodies:
+        _draw_body(screen, body)
+
+def draw_world_static(surface, world):
+    """배경 + 정적 바디(장애물)만 그림 - 한 번 그려두고 매 프레임 blit"""
+    surface.fill(BACKGROUND)
+
+    for body in world.bodies:
+        if body.type == staticBody:
+            _draw_body(surface, body)
+
+def draw_world_dynamic(screen, world):
+    """움직이는 바디(로봇 링크)만 그리고, 그려진 영역 전체를 감싸는 Rect 반환 (없으면 None)"""
+    rects = []
+    for body in world.bodies:
+        if body.type != staticBody:
+            rects.extend(_draw_body(screen, body))
+    return rects[0].unionall(rects[1:]) if rects else None
@@ -0,0 +1,61 @@
+# robot_builder.py - 로봇 링크/관절 생성 (env.py의 정적/포인트클라우드 월드 공용)
+from Box2D.b2 import revoluteJointDef
+import functools
+import numpy as np
+
+@functools.lru_cache(maxsize=32)
+def _ellipse_vertices(width, height, num_points):
+    """타원형 버텍스 계산 (링크/에피소드 간 재사용을 위해 캐시)"""
+    angles = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+    verts = np.column_stack((width * np.cos(angles), height * np.sin(angles)))
+    return tuple(map(tuple, verts.tolist()))
+
+def create_ellipse_vertices(width, height, num_points=16):
+    """타원형 버텍스 생성"""
+    return list(_ellipse_vertices(width, height, num_points))
+
+def create_robot_links(W, geometry_config):
+    """Create robot links in given world
+
+    Returns:
+        tuple: (base, links)
+    """
+    # 고정 베이스
+    base = W.CreateStaticBody(position=(0,0))
+
+    # Get robot configuration (루프 안의 dict 조회를 피하기 위해 로컬로 바인딩)
+    link_lengths = geometry_config['link_lengths']
+    link_widths = geometry_config['link_widths']
+    is_ellipse = geometry_config['link_shape'] == "ellipse"
+    create_body = W.CreateDynamicBody
+
+    # 각 링크 시작점의 누적 오프셋 (O(N))
+    offsets = np.concatenate(([0.0], np.cumsum(link_lengths[:-1])))
+
+    links = []
+    for i, length in enumerate(link_lengths):
+        x = float(offsets[i]) + length/2
+        body = create_body(position=(x, 0), angle=0)
+
+        if is_ellipse:
+            # 타원형 링크 - geometry config의 width를 기반으로 타원 크기 계산
+            ellipse_width = length * 0.5  # 링크 길이에 비례한 타원 폭
+            ellipse_height = link_widths[i]  # geometry config의 width를 높이로 사용
+            vertices = _ellipse_vertices(ellipse_width, ellipse_height, 16)
+            body.CreatePolygonFixture(vertices=vertices, density=1, friction=0.3)
+        else:
+            # 기본 사각형 링크
+            body.CreatePolygonFixture(box=(length/2, link_widths[i]/2), density=1, friction=0.3)
+
+        links.append(body)
+
+    # 관절 연결 (베이스-1, 1-2, 2-3)
+    W.CreateJoint(revoluteJointDef(bodyA=base,   bodyB=links[0],
+                                   localAnchorA=(0,0),
+                                   localAnchorB=(-link_lengths[0]/2,0)))
+    for i in range(len(links)-1):
+        W.CreateJoint(revoluteJointDef(bodyA=links[i], bodyB=links[i+1],
+                                       localAnchorA=(link_lengths[i]/2,0),
+                                       localAnchorB=(-link_lengths[i+1]/2,0)))
+
+    return base, links
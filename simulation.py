@@ -2,14 +2,18 @@
 simulation.py - 공통 시뮬레이션 로직
 main.py와 record_video.py에서 공유하는 시뮬레이션 코드
 """
+import logging
 import numpy as np
 from Box2D.b2 import revoluteJointDef
 from policy import potential_field_policy, potential_field_pd_policy, rmp_policy
 
+log = logging.getLogger(__name__)
+
 class RobotSimulation:
     """로봇 시뮬레이션 클래스"""
     
-    def __init__(self, world, links, obstacles, target, policy_type="potential_field_pd"):
+    def __init__(self, world, links, obstacles, target, policy_type="potential_field_pd",
+                 vel_iters=6, pos_iters=2):
         self.world = world
         self.links = links
         self.obstacles = obstacles
@@ -17,42 +21,43 @@ class RobotSimulation:
         self.joints = world.joints
         self.policy_type = policy_type
         
+        # 토크를 적용할 조인트별 body와 바운드 메서드 (매 스텝 SWIG 속성 조회 방지)
+        self._joint_bodies = [j.bodyB for j in self.joints]
+        self._apply_torques = [b.ApplyTorque for b in self._joint_bodies]
+        self._end_effector = links[-1]
+        self._world_step = world.Step
+        
         # 시뮬레이션 상태
         self.prev_end_pos = None
         self.link_lengths = [3.0, 2.5, 2.0]  # 링크 길이
+        self._link_lengths_arr = np.array(self.link_lengths)
         
-        # 물리 설정
+        # 물리 설정 (3링크 + 소수 장애물에는 6/2로 충분, 충돌이 많은 포인트클라우드 환경은 더 높게)
         self.TIME_STEP = 1.0/60.0
-        self.VEL_ITERS = 10
-        self.POS_ITERS = 10
+        self.VEL_ITERS = vel_iters
+        self.POS_ITERS = pos_iters
         
     def get_joint_angles(self):
         """현재 조인트 각도 계산 (누적)"""
-        q1 = self.joints[0].angle if len(self.joints) > 0 else 0
-        q2 = q1 + self.joints[1].angle if len(self.joints) > 1 else q1
-        q3 = q2 + self.joints[2].angle if len(self.joints) > 2 else q2
+        joints = self.joints
+        n = len(joints)
+        q1 = joints[0].angle if n > 0 else 0
+        q2 = q1 + joints[1].angle if n > 1 else q1
+        q3 = q2 + joints[2].angle if n > 2 else q2
         return [q1, q2, q3]
     
     def compute_jacobian(self):
         """해석적 Jacobian 계산"""
-        angles = self.get_joint_angles()
-        q1, q2, q3 = angles
-        L = self.link_lengths
-        
-        # Jacobian J2 (2×3) 계산
-        J2 = np.zeros((2, 3))
-        
-        # dP/dq1
-        J2[0, 0] = -L[0]*np.sin(q1) - L[1]*np.sin(q2) - L[2]*np.sin(q3)
-        J2[1, 0] = L[0]*np.cos(q1) + L[1]*np.cos(q2) + L[2]*np.cos(q3)
+        q = np.array(self.get_joint_angles())
+        L = self._link_lengths_arr
         
-        # dP/dq2
-        J2[0, 1] = -L[1]*np.sin(q2) - L[2]*np.sin(q3)
-        J2[1, 1] = L[1]*np.cos(q2) + L[2]*np.cos(q3)
+        # 링크별 기여분 L_i*sin(q_i), L_i*cos(q_i)
+        sx = L * np.sin(q)
+        cx = L * np.cos(q)
         
-        # dP/dq3
-        J2[0, 2] = -L[2]*np.sin(q3)
-        J2[1, 2] = L[2]*np.cos(q3)
+        # Jacobian J2 (2×3): dP/dq_j = Σ_{i>=j} (-L_i sin q_i, L_i cos q_i)
+        J2 = np.vstack((-np.cumsum(sx[::-1])[::-1],
+                        np.cumsum(cx[::-1])[::-1]))
         
         return J2
     
@@ -74,7 +79,7 @@ class RobotSimulation:
         F = self.get_policy_force()
         
         # 2) 현재 end-effector 위치 저장
-        current_end_pos = np.array(self.links[-1].worldCenter)
+        current_end_pos = np.array(self._end_effector.worldCenter)
         
         # 3) Jacobian 계산
         J2 = self.compute_jacobian()
@@ -82,19 +87,19 @@ class RobotSimulation:
         # 4) 토크 계산 (J^T * F)
         tau = J2.T.dot(F)
         
-        # 5) 디버그 출력
-        if debug:
+        # 5) 디버그 출력 (DEBUG 레벨이 아니면 문자열 포맷팅도 생략)
+        if debug and log.isEnabledFor(logging.DEBUG):
             angles = self.get_joint_angles()
-            print(f"End-effector: {current_end_pos}, Target: {self.target}, Force: {F}")
-            print(f"Joint angles: [{angles[0]:.3f}, {angles[1]:.3f}, {angles[2]:.3f}]")
-            print(f"Torques: {tau}")
+            log.debug(f"End-effector: {current_end_pos}, Target: {self.target}, Force: {F}")
+            log.debug(f"Joint angles: [{angles[0]:.3f}, {angles[1]:.3f}, {angles[2]:.3f}]")
+            log.debug(f"Torques: {tau}")
         
         # 6) 토크 적용
-        for j, t in zip(self.joints, tau):
-            j.bodyB.ApplyTorque(t, wake=True)
+        for apply_torque, t in zip(self._apply_torques, tau.tolist()):
+            apply_torque(t, True)
         
         # 7) 물리 스텝
-        self.world.Step(self.TIME_STEP, self.VEL_ITERS, self.POS_ITERS)
+        self._world_step(self.TIME_STEP, self.VEL_ITERS, self.POS_ITERS)
         
         # 8) 다음 프레임을 위해 이전 위치 업데이트
         self.prev_end_pos = current_end_pos.copy()